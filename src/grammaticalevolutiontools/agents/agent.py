@@ -2,7 +2,6 @@ from .agent_program import AgentProgramTree
 from ..grammars import Grammar
 
 from numbers import Number
-from uuid import uuid4
 
 from typing import Type, TYPE_CHECKING
 import warnings
@@ -30,6 +29,8 @@ class Agent:
         
         return getattr(cls, mangled, None)
     
+    __slots__ = ('_world', '_program', '_score', '_num_actions')
+
     _default_grammar = None
     _requires_world = False
 
@@ -52,7 +53,6 @@ class Agent:
     def __init__(self, program: AgentProgramTree = None, autogen=True):
         self._world: World = None
         self._program: AgentProgramTree = None
-        self._uuid = uuid4()       # just to make hashable
 
         self._score = 0
         self._num_actions = 0
@@ -202,8 +202,8 @@ class Agent:
     
     # - - Other Methods - -
     
-    def __hash__(self):
-        return hash(self._uuid)
+    # agents are compared and hashed by identity
+    __hash__ = object.__hash__
     
     def __lt__(self, other):
         if not isinstance(other, Agent):
@@ -65,11 +65,14 @@ class AgentProgramTree(ProgramTree, GrammarProgramAddin):
 
         Parameters
         ----------
-        agent : Agent
-            The agent instance to bind the program to.
+        agent : Agent or None
+            The agent instance to bind the program to, or :py:obj:`None`
+            to unbind the program.
         """
-        self._assert_agent_valid(agent)
+        if agent is not None:
+            self._assert_agent_valid(agent)
         self._agent = agent
+        self._update_editable()
     
     # - - Public Methods
 
@@ -18,10 +18,11 @@ def pick_compatible_nodes_same_type_only(
     # Get all eligible node types from program1 (excluding root and incompatible types)
     eligible_types = set()
     possible_node1s = []
+    program2_types = program2.node_types
     
     for node_type in program1.types_iter():
         if not issubclass(node_type, incompatible_types) \
-            and node_type in program2.node_types:
+            and node_type in program2_types:
             eligible_types.add(node_type)
             possible_node1s.extend(program1.get_nodes_by_type(node_type))
     
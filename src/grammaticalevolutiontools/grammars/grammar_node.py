@@ -1,6 +1,7 @@
 from ..meta import BaseNode
 
 import numpy as np
+import sys
 from typing import Type, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -52,6 +53,8 @@ class GrammarNode(BaseNode):
                 raise TypeError(f"Class attribute '{attr}' must be defined in {cls.__name__}, and cannot be 'NotImplemented'.")
                  
         GrammarNode._assert_token_valid(cls._TOKEN)
+        if type(cls._TOKEN) is str:
+            cls._TOKEN = sys.intern(cls._TOKEN)
         GrammarNode._assert_label_valid(cls._LABEL)
         GrammarNode._assert_tags_valid(cls._IS_TERMINAL, cls._IS_ROOT)
         GrammarNode._assert_max_num_children_valid(cls._MAX_NUM_CHILDREN, cls._IS_TERMINAL)
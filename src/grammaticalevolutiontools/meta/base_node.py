@@ -2,12 +2,16 @@ from .meta import BaseNodeMeta
 
 from abc import abstractmethod
 import warnings
-import uuid
+import itertools
 
 import numpy as np
 
 from typing import Type, Tuple, Optional, Any, Literal
 
+# source of unique node identifiers. Much cheaper than a uuid per node,
+# which needs a call to os.urandom for every node created
+_node_ids = itertools.count()
+
 class BaseNode(metaclass=BaseNodeMeta):
     """Abstract base class for all nodes.
 
@@ -30,6 +34,11 @@ class BaseNode(metaclass=BaseNodeMeta):
     Internal attributes (prefixed with `_`) are managed by the class and
     typically not intended for direct external access.
 
+    The attributes listed below are stored in `__slots__` to keep the per-node
+    footprint small, since a program tree can hold many thousands of nodes.
+    Subclasses that do not declare `__slots__` of their own still receive an
+    instance `__dict__`, so custom attributes can be added as usual.
+
     See Also
     --------
     :py:class:`~.meta.BaseNodeMeta`
@@ -43,8 +52,9 @@ class BaseNode(metaclass=BaseNodeMeta):
         A list representing the child slots of this node. Each element
         is either a :py:class:`~.BaseNode` instance or :py:obj:`None` if the slot is empty.
         The length of this list is determined by :py:attr:`~.BaseNode.max_num_children`.
-    _identifier : uuid.UUID
-        A unique identifier for this specific node instance.
+    _identifier : int
+        A unique identifier for this specific node instance, drawn from a
+        process-wide counter.
         This is used for hashing and distinguishing between node instances.
     _parent : BaseNode or None
         A reference to the parent :py:class:`~.BaseNode` of this node, or
@@ -55,6 +65,9 @@ class BaseNode(metaclass=BaseNodeMeta):
 
     """
 
+    __slots__ = ('_num_children', '_children', '_identifier',
+                 '_parent', '_depth', '_attr_cache', '__weakref__')
+
     # - - Assertion Utilities - -
 
     @staticmethod
@@ -381,6 +394,46 @@ class BaseNode(metaclass=BaseNodeMeta):
         """
         return np.atleast_1d(np.array(probs, dtype=np.float64))
 
+    @staticmethod
+    def probs_to_alias_table(probs) -> tuple[list[float], list[int]]:
+        """Builds a Vose alias table from a list or array of probabilities.
+
+        The probabilities are treated as relative weights, so they do not need to
+        sum to one. With the table, drawing an index takes a single uniform random
+        number: scale it by the number of entries, take the integer part `j`, and
+        keep `j` if the fractional part is below `prob[j]`, otherwise use `alias[j]`.
+
+        Parameters
+        ----------
+        probs : list[float] or numpy.ndarray
+            The probabilities (or weights) to convert.
+
+        Returns
+        -------
+        tuple[list[float], list[int]]
+            The acceptance probability and the alias index for each entry.
+        """
+        weights = BaseNode.probs_to_numpy(probs)
+        n = weights.size
+        if n == 0:
+            return [], []
+        
+        scaled = (weights * (n / weights.sum())).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        
+        # anything left over is 1.0 up to rounding error
+        return prob, alias
+
     @staticmethod
     def convert_probs_dict_to_numpy(
             special_child_probs_dict: dict[int, list[float]],
@@ -435,10 +488,8 @@ class BaseNode(metaclass=BaseNodeMeta):
         It must be called by subclasses.
         """
         self._num_children = 0
-        self._children: list[BaseNode] = [
-            None for _ in range(self.max_num_children)
-        ]
-        self._identifier = uuid.uuid4()
+        self._children: list[BaseNode] = [None] * self.max_num_children
+        self._identifier = next(_node_ids)
         self._parent: BaseNode = None
         self._depth: int = 0
         self._attr_cache: dict[str, Any] = {}
@@ -598,9 +649,9 @@ class BaseNode(metaclass=BaseNodeMeta):
         """
         child = self._children[index]
         self._children[index] = None
-        self._num_children -= 1
         
-        if child:
+        if child is not None:
+            self._num_children -= 1
             properties = self._get_properties_for_popped_child()
             child._set_properties(properties)
             child.collect_descendants(traversal_mode='detach')
@@ -647,6 +698,82 @@ class BaseNode(metaclass=BaseNodeMeta):
 
         return old_child
 
+    def set_children(self, children: list[Optional['BaseNode']]):
+        """Adds several children to this node's empty slots at once.
+
+        Every entry is checked as :py:meth:`~.BaseNode.add_child` would
+        check it before any child is placed. The new branches are then
+        attached with a single traversal, whereas adding them one at a
+        time would traverse this node's subtree once per child.
+
+        Parameters
+        ----------
+        children : list of BaseNode or None
+            One entry per child slot of this node. Each non-:py:obj:`None`
+            entry is added at its own index, and :py:obj:`None` entries
+            leave their slot as it is.
+
+        Raises
+        ------
+        ValueError
+            If `children` does not have one entry per child slot.
+            If a node appears more than once or is already a child of this node.
+            If a node already has a parent.
+            If adding the children would create a cycle in the tree.
+        IndexError
+            If a slot given a new child is already occupied.
+        TypeError
+            If a node is not of a type permitted at its index.
+        """
+        if len(children) != len(self._children):
+            raise ValueError(
+                f"Expected {len(self._children)} entries, one per child "
+                f"slot. Found {len(children)}."
+            )
+
+        possible_children_dict = self._possible_children_dict
+        new_children = []
+        seen = set()
+        for index, new_child in enumerate(children):
+            if new_child is None:
+                continue
+            if new_child in seen or new_child in self._children:
+                raise ValueError(
+                    "new_child already in list of children. "
+                    "Cannot occupy two slots at once. "
+                    "Please make a copy instead."
+                )
+            if self._children[index] is not None:
+                raise IndexError(
+                    f"Another child already exists at index {index}. "
+                    + "Try using replace_child() instead to overwrite."
+                )
+            if type(new_child) not in possible_children_dict[index]:
+                permitted_types = possible_children_dict[index]
+                raise TypeError(
+                     "new_child does not match possible child types for a node "
+                    f"of type {type(self)}.\n"
+                    f"Permitted types include {permitted_types}"
+                )
+            if new_child._parent is not None:
+                raise ValueError("New child already has a parent.")
+
+            seen.add(new_child)
+            new_children.append(index)
+
+        for index in new_children:
+            self._children[index] = children[index]
+        self._num_children += len(new_children)
+
+        try:
+            self.collect_descendants(traversal_mode='attach')
+        except RuntimeError as e:
+            for index in new_children:
+                self._children[index] = None
+            self._num_children -= len(new_children)
+
+            raise ValueError("New child caused a cycle.") from e
+
     def remove_all_children(self):
         """Removes all children from this node.
 
@@ -700,38 +827,53 @@ class BaseNode(metaclass=BaseNodeMeta):
 
     def _collect_descendants(self, visited: set['BaseNode'],
                              traversal_mode: TraversalMode) -> bool:
-        """Recursively collects descendants for :py:meth:`~.BaseNode.collect_descendants`.
+        """Collects descendants for :py:meth:`~.BaseNode.collect_descendants`.
 
-        This is an internal helper method used for the recursive traversal.
-        It adds the current node to `node_set` and then recursively calls
-        itself for each child. It includes a check for cycles.
+        This is an internal helper method that walks the subtree depth-first
+        with an explicit stack, so deep trees neither pay for a Python frame
+        per node nor run into the recursion limit. Nodes are visited in the
+        same pre-order as a recursive walk, and each child receives its
+        parent's properties just before it is visited. It includes a check
+        for cycles.
 
         Parameters
         ----------
-        node_set : set[BaseNode]
+        visited : set[BaseNode]
             The set to which discovered nodes are added. This set also serves
             to track visited nodes for cycle detection.
+        traversal_mode : TraversalMode
+            The traversal mode passed to each node's collection hook.
 
-        Raises
-        ------
-        ValueError
-            If a cycle is detected (the current node is already in `node_set`).
+        Returns
+        -------
+        bool
+            :py:obj:`False` if a cycle was detected (a node was reached more
+            than once), :py:obj:`True` otherwise.
         """
-        if self in visited:
-            return False
+        stack = [(self, None)]
+        while stack:
+            node, properties = stack.pop()
+            if properties is not None:
+                node._set_properties(properties)
+
+            if node in visited:
+                return False
             
-        visited.add(self)
-        self._on_collect_descendants(traversal_mode)
-        
-        modifying_children = traversal_mode in ['attach', 'detach']
-        properties = (modifying_children and \
-                      self._get_properties_to_pass_to_children()) or {}
-        
-        for child in self._children:
-            if child is not None:
-                child._set_properties(properties)
-                if not child._collect_descendants(visited, traversal_mode):
-                    return False
+            visited.add(node)
+            node._on_collect_descendants(traversal_mode)
+
+            # the properties dict is built on the first child found and shared 
+            # by all the others, so leaves never build one at all. Children
+            # are pushed in reverse so they are popped in index order.
+            properties = None
+            for child in reversed(node._children):
+                if child is not None:
+                    if properties is None:
+                        if traversal_mode in ['attach', 'detach']:
+                            properties = node._get_properties_to_pass_to_children()
+                        else:
+                            properties = {}
+                    stack.append((child, properties))
         
         return True
     
@@ -760,6 +902,13 @@ class BaseNode(metaclass=BaseNodeMeta):
         performs a deep copy of the children from the `other` node,
         adding them to the corresponding slots.
 
+        The branch is cloned top-down with an explicit stack. Each copy is
+        placed straight into its parent's slot, and parents and depths are
+        set by a single attach traversal at the end. Attaching each child
+        with :py:meth:`~.BaseNode.add_child` would re-traverse the subtree
+        on every add. Children whose class overrides :py:meth:`~.BaseNode.copy`
+        are copied with their own method.
+
         Parameters
         ----------
         other : BaseNode
@@ -778,11 +927,24 @@ class BaseNode(metaclass=BaseNodeMeta):
         # copy children over
         self.remove_all_children()
 
-        for index, child in enumerate(other.children):
-            if child is not None:
-                type(self).add_child(self, child.copy(), index=index)
-            else:
-                self._children[index] = None
+        stack = [(self, other)]
+        while stack:
+            dup, original = stack.pop()
+            for index, child in enumerate(original._children):
+                if child is None:
+                    continue
+
+                child_type = type(child)
+                if child_type.copy is BaseNode.copy:
+                    child_dup = child_type()
+                    stack.append((child_dup, child))
+                else:
+                    child_dup = child.copy()
+
+                dup._children[index] = child_dup
+                dup._num_children += 1
+
+        self.collect_descendants(traversal_mode='attach')
     
     def _set_properties(self, properties: dict[str, Any]):
         # Method for a parent to set the properties of its children
@@ -1019,7 +1181,7 @@ class BaseNode(metaclass=BaseNodeMeta):
             A list containing references to the direct child :py:class:`~.BaseNode`
             instances, or :py:obj:`None` for unoccupied slots.
         """
-        return [child for child in self._children]
+        return self._children.copy()
     
 
     # - - Abstract Properties - -
@@ -1174,17 +1336,8 @@ class BaseNode(metaclass=BaseNodeMeta):
             A string with comma-separated string representations of the children.
             Empty slots are represented as empty strings.
         """
-        children = self.children
-        _str = ""
-        for i in range(len(children)):
-            child = children[i]
-            if child is None:
-                chld_str = ""
-            else:
-                chld_str = str(child)
-            _str += chld_str + (", " if i < len(children) - 1 else "")
-
-        return _str
+        return ", ".join("" if child is None else str(child) 
+                         for child in self._children)
     
     def _default_copy_method(self, *args, **kwargs):
         """Provides a default deep copy mechanism for BaseNode and its subclasses.
@@ -1238,7 +1391,7 @@ class BaseNode(metaclass=BaseNodeMeta):
         str
             A string representation of the node, showing its structure and content.
         """
-        if self.num_children == 0:
+        if self._num_children == 0:
             return str(self.token)
         else:
             _str = self._children_as_string()
@@ -17,41 +17,44 @@ class BaseNodeMeta(ABCMeta):
     or subclasses of their `_ORIGINAL_NODE_CLS` within the `BaseNode` hierarchy.
     """
 
-    def __call__(cls, *args, **kwargs):
+    def __new__(mcs, name, bases, namespace, **kwargs):
         """
-        Custom `__call__` method for class instantiation.
+        Custom `__new__` method for class creation.
 
-        This method is invoked when an attempt is made to create an instance
-        of a class using this metaclass. It prevents the instantiation of
-        concrete `BaseNode` subclasses if their `__init__` method
-        requires arguments other than `self`, ensuring a consistent
-        instantiation pattern across the node hierarchy.
+        Creates the class with `abc.ABCMeta` and then applies the custom 
+        abstractness rule once, up front: if the class's initialization still
+        requires arguments beyond `self` (see :py:meth:`_init_has_extra_args`),
+        `__init__` is added to the class's `__abstractmethods__`. Python's own
+        abstract class check in `object.__new__` then prevents the class from 
+        being instantiated, so no check is needed on each instantiation. The
+        result is kept in the class's `_INIT_HAS_EXTRA_ARGS` attribute, so
+        :py:meth:`is_abstract_class` does not inspect signatures again.
 
         Parameters
         ----------
-        *args : tuple
-            Positional arguments passed to the class constructor.
-        **kwargs : dict
-            Keyword arguments passed to the class constructor.
+        mcs : type
+            The metaclass itself.
+        name : str
+            The name of the new class being created.
+        bases : tuple
+            A tuple of base classes for the new class.
+        namespace : dict
+            A dictionary of attributes for the new class.
 
         Returns
         -------
-        object
-            An instance of the class if it passes the abstraction checks.
-
-        Raises
-        ------
-        TypeError
-            If attempting to instantiate an abstract class or a concrete class
-            whose `__init__` method takes extra arguments.
+        type
+            The newly created class.
         """
-        if cls._init_has_extra_args():
-            raise TypeError("Cannot instantiate abstract node class "
-                            f"{cls.__name__}. All concrete node classes "
-                            "must not require any arguments in their "
-                            "__init__ function besides self.")
-        
-        return ABCMeta.__call__(cls, *args, **kwargs)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        # the signature inspection is slow, so it is done once per class
+        # and cached for is_abstract_class
+        cls._INIT_HAS_EXTRA_ARGS = cls._init_has_extra_args()
+        if cls._INIT_HAS_EXTRA_ARGS:
+            cls.__abstractmethods__ = cls.__abstractmethods__ | {'__init__'}
+
+        return cls
     
     def _defines_init_(cls):
         """
@@ -74,6 +77,8 @@ class BaseNodeMeta(ABCMeta):
 
         This method leverages Python's built-in `__abstractmethods__` attribute
         (managed by `abc.ABCMeta`) to determine if a class is still abstract.
+        An `__init__` entry added only because `__init__` requires extra
+        arguments (see :py:meth:`__new__`) is not counted.
 
         Returns
         -------
@@ -81,9 +86,15 @@ class BaseNodeMeta(ABCMeta):
             `True` if the class has one or more abstract methods, `False` otherwise.
         """
         try:
-            return len(cls.__abstractmethods__) > 0
+            abstract_methods = cls.__abstractmethods__
         except AttributeError:
             return False
+        
+        if '__init__' in abstract_methods and \
+                not getattr(cls.__init__, '__isabstractmethod__', False):
+            abstract_methods = abstract_methods - {'__init__'}
+
+        return len(abstract_methods) > 0
 
     def _init_has_extra_args(cls) -> bool:
         """
@@ -107,6 +118,24 @@ class BaseNodeMeta(ABCMeta):
         
         return len(params) > 1
     
+    def _cached_init_has_extra_args(cls) -> bool:
+        """
+        Returns :py:meth:`_init_has_extra_args`, as cached by :py:meth:`__new__`.
+
+        Hooks such as `__init_subclass__` run before :py:meth:`__new__` has
+        stored the result, so the check is made directly in that case. The 
+        class's own `__dict__` is read to avoid picking up a parent's value.
+
+        Returns
+        -------
+        bool
+            `True` if `__init__` has parameters other than `self`, `False` otherwise.
+        """
+        has_extra_args = cls.__dict__.get('_INIT_HAS_EXTRA_ARGS')
+        if has_extra_args is None:
+            has_extra_args = cls._init_has_extra_args()
+        return has_extra_args
+    
     def is_abstract_class(cls):
         """
         Determines if a class is considered abstract by this metaclass's rules.
@@ -127,7 +156,7 @@ class BaseNodeMeta(ABCMeta):
             cls._has_abstract_methods()
             or (
                 cls._defines_init_() and
-                cls._init_has_extra_args()
+                cls._cached_init_has_extra_args()
             )
         )
 
@@ -2,6 +2,10 @@ from ...meta import BaseNode
 
 import warnings
 import inspect
+import sys
+import weakref
+from contextlib import contextmanager
+from enum import IntEnum
 
 import numpy as np
 
@@ -11,6 +15,11 @@ if TYPE_CHECKING:
     from .program_tree import ProgramTree
 
 
+# node classes already accepted by ProgramNode._assert_possible_child_type_is_valid.
+# Weak references let classes defined at runtime be garbage collected.
+_valid_child_types = weakref.WeakSet()
+
+
 class ProgramNode(BaseNode):
     """Represents a node within a program tree, extending BaseNode.
 
@@ -35,6 +44,10 @@ class ProgramNode(BaseNode):
     SHOW_WARNINGS : bool
         A class-level flag that controls whether warnings are shown during
         assertion checks (e.g., for unused indices in probability dictionaries).
+    FAST_CONSTRUCT : bool
+        A class-level flag that skips :py:meth:`~.ProgramNode._assert_vals_valid`
+        when nodes are constructed. Usually set through
+        :py:meth:`~.ProgramNode.fast_construct`.
     _program_tree_cls : Type['ProgramTree'] or None
         A cached reference to the `ProgramTree` class, imported lazily.
     _token : str
@@ -83,9 +96,34 @@ class ProgramNode(BaseNode):
     All custom properties specific to `ProgramNode` or its further subclasses,
     which are not directly related to `BaseNode`'s core attributes, should be
     defined and initialized within the :py:meth:`~.ProgramNode._custom_init` method.
+
+    The attributes above are stored in `__slots__`. Subclasses that do not
+    declare `__slots__` themselves still get an instance `__dict__` for any
+    custom attributes set in :py:meth:`~.ProgramNode._custom_init`.
     """
 
+    __slots__ = ('_token', '_label', '_is_terminal', '_is_root',
+                 '_max_num_children', '__possible_children_dict',
+                 '__special_child_probs', '__all_possible_children',
+                 '_program', '_own_child_dist')
+
     SHOW_WARNINGS: bool = True
+    FAST_CONSTRUCT: bool = False
+
+    class Kind(IntEnum):
+        """An enumeration of the roles a node can play when a program is run."""
+        OTHER = 0
+        """The node is never run directly (e.g. factor nodes)."""
+        EXECUTABLE = 1
+        """The node performs an action when run."""
+        NON_TERMINAL = 2
+        """The node decides which of its children to run."""
+
+    NODE_KIND: Kind = Kind.OTHER
+    """The :py:class:`~.ProgramNode.Kind` of this node class. Checking it is 
+    a single attribute read, so execution code uses it instead of 
+    :py:func:`isinstance` to tell executable and non-terminal nodes apart.
+    """
 
     # - - - - - - - - - - - - - - -
 
@@ -121,6 +159,32 @@ class ProgramNode(BaseNode):
         
         return len(params1) > 1 or len(params2) > 1
     
+    @staticmethod
+    @contextmanager
+    def fast_construct():
+        """Context manager that skips value validation for nodes built inside it.
+
+        While active, :py:attr:`~.ProgramNode.FAST_CONSTRUCT` is set, so
+        :py:meth:`~.ProgramNode._base_node_init` does not run 
+        :py:meth:`~.ProgramNode._assert_vals_valid`. Use it when building 
+        many nodes of classes whose definitions are already known to be 
+        valid, such as when constructing large populations. The previous 
+        value of the flag is restored on exit.
+
+        Examples
+        --------
+        .. code-block:: python
+
+            with ProgramNode.fast_construct():
+                population = [ProgramTree(MyRoot) for _ in range(1000)]
+        """
+        previous = ProgramNode.FAST_CONSTRUCT
+        ProgramNode.FAST_CONSTRUCT = True
+        try:
+            yield
+        finally:
+            ProgramNode.FAST_CONSTRUCT = previous
+
     # - - - - - - - - - - - - - - -
 
     # - - Assertions - -
@@ -144,6 +208,11 @@ class ProgramNode(BaseNode):
         ValueError
             If `node_type` is a class designated as a root node.
         """
+        # every node construction re-validates its possible children, so
+        # types that have passed once are remembered for the whole process
+        if node_type in _valid_child_types:
+            return
+        
         if not isinstance(node_type, type) or \
                 not issubclass(node_type, ProgramNode):
             raise TypeError(
@@ -151,6 +220,8 @@ class ProgramNode(BaseNode):
                 f"Type[{ProgramNode.__name__}]. "
                 f"Obj at fault: {node_type}"
             )
+        
+        _valid_child_types.add(node_type)
 
         node_type: Type[ProgramNode]
 
@@ -193,8 +264,9 @@ class ProgramNode(BaseNode):
         )
 
     def _assert_editable(self):
-        if self._program:
-            self._program._assert_editable()
+        program = self._program
+        if program is not None and not program._editable:
+            program._assert_editable()
 
     # - - Initialization Helpers - - 
 
@@ -202,9 +274,11 @@ class ProgramNode(BaseNode):
                                 special_child_probs_dict: dict):
         """Initializes the node's `__possible_children_dict` and `__special_child_probs`.
 
-        This helper method iterates through the provided dictionaries and
-        sets the possible children types and their associated probabilities
-        for each child index using :py:meth:`~.ProgramNode._set_possible_children`.
+        This helper method makes a single pass over the provided dictionaries,
+        validating each distinct node type only once (the same type often appears 
+        at several indices), copying the lists of possible children into 
+        `__possible_children_dict`, and setting any probabilities for each index 
+        via :py:meth:`~.ProgramNode._set_child_probs`.
 
         Parameters
         ----------
@@ -213,13 +287,29 @@ class ProgramNode(BaseNode):
         special_child_probs_dict : dict[int, list[float]]
             A dictionary defining custom probability distributions for child
             selection at specific indices.
+
+        Raises
+        ------
+        TypeError
+            If any node type in `possible_children_dict` is invalid.
+        ValueError
+            If any list of probabilities has a size mismatch with the
+            possible children at its index.
         """
+        validated = set()
         for ind, psbl_chld_list in possible_children_dict.items():
-            if ind in special_child_probs_dict:
-                self._set_possible_children(
-                    ind, psbl_chld_list, special_child_probs_dict[ind])
-            else:
-                self._set_possible_children(ind, psbl_chld_list)
+            for node_cls in psbl_chld_list:
+                if node_cls not in validated:
+                    self._assert_possible_child_type_is_valid(node_cls)
+                    validated.add(node_cls)
+
+            self.__possible_children_dict[ind] = psbl_chld_list.copy()
+
+            special_probs = special_child_probs_dict.get(ind)
+            if special_probs is not None:
+                self._set_child_probs(ind, special_probs)
+
+        self.__all_possible_children.update(validated)
 
     def _set_possible_children(self, index: int, 
                                possible_children_list: list[
@@ -254,6 +344,7 @@ class ProgramNode(BaseNode):
         for node_cls in possible_children_list:
             self._assert_possible_child_type_is_valid(node_cls)
 
+        self._own_child_dist = True
         self.__possible_children_dict[index] = possible_children_list.copy()
         self.__all_possible_children.update(
             self.__possible_children_dict[index])
@@ -297,6 +388,7 @@ class ProgramNode(BaseNode):
                 "possible children at specified index."
             )
 
+        self._own_child_dist = True
         self.__special_child_probs[index] = np.array(probs)
 
 
@@ -322,6 +414,9 @@ class ProgramNode(BaseNode):
         :py:meth:`~.ProgramNode._init_has_extra_args` and `BaseNodeMeta`.
         """
         self._base_node_init()
+        # distributions set up by _base_node_init are the same for every
+        # instance of the class; only later changes make them this node's own
+        self._own_child_dist = False
         self._custom_init()
 
     def _base_node_init(self, token: str, is_terminal: bool, 
@@ -414,7 +509,8 @@ class ProgramNode(BaseNode):
         if special_child_probs is None:
             special_child_probs = {}
 
-        self._token: str = token
+        # tokens are shared by every node of a class, so intern them once
+        self._token: str = sys.intern(token) if type(token) is str else token
         self._label: str = label
         self._is_terminal: bool = is_terminal
         self._is_root: bool = is_root
@@ -430,7 +526,8 @@ class ProgramNode(BaseNode):
             possible_children_dict, 
             special_child_probs)
 
-        self._assert_vals_valid()
+        if not ProgramNode.FAST_CONSTRUCT:
+            self._assert_vals_valid()
 
         super(ProgramNode, self).__init__()
 
@@ -513,16 +610,46 @@ class ProgramNode(BaseNode):
         index = BaseNode.add_child(self, new_child, index=index)  
 
         if self._program:
-            self._program._cache_depth()
+            self._program._update_incomplete(self)
         
         return index
 
+    def set_children(self, children: list[Optional['ProgramNode']]):
+        """Adds several `ProgramNode` children to this node's empty slots at once.
+
+        This method extends the functionality of `BaseNode.set_children` in
+        the same way :py:meth:`~.ProgramNode.add_child` extends
+        `BaseNode.add_child`, but checks editability and updates the
+        program's incomplete nodes only once for all of the new children.
+
+        Parameters
+        ----------
+        children : list of ProgramNode or None
+            One entry per child slot of this node. :py:obj:`None` entries
+            leave their slot as it is.
+
+        Raises
+        ------
+        ValueError
+            If any of the new children is already part of another `ProgramTree`.
+            If any of the new children is rejected by `BaseNode.set_children`.
+        """
+        self._assert_editable()
+        for new_child in children:
+            if new_child is not None and new_child._program:
+                raise ValueError("new_child must not be part of another program.")
+
+        BaseNode.set_children(self, children)
+
+        if self._program:
+            self._program._update_incomplete(self)
+
     def pop_child(self, index) -> 'ProgramNode':
         self._assert_editable()
         removed_node = BaseNode.pop_child(self, index)
 
         if self._program:
-            self._program._cache_depth()
+            self._program._update_incomplete(self)
         
         return removed_node
 
@@ -539,26 +666,52 @@ class ProgramNode(BaseNode):
         return properties
     
     def _on_collect_descendants_attach(self):
-        if self._program and not (self in self._program._nodes):
-            self._program._nodes.add(self)
-            self._program._nodes_by_type[type(self)].add(self)
-            self._program._level_counts[self._depth] += 1
+        program = self._program
+        if program is None:
+            return
+        
+        program._schedule = None
+        if self not in program._nodes:
+            program._nodes_snapshot = None
+            program._nodes.add(self)
+            program._nodes_by_type[self.__class__].add(self)
+            if self._num_children < len(self._children):
+                program._incomplete.add(self)
+
+            level_counts = program._level_counts
+            depth = self._depth
+            if depth < len(level_counts):
+                level_counts[depth] += 1
+            else:
+                # first node on a new level of the tree
+                level_counts.extend([0] * (depth - len(level_counts)))
+                level_counts.append(1)
 
     def _on_collect_descendants_detach(self):
         program: ProgramTree = self._attr_cache.get('_program')
-        if program and (self in program._nodes):
+        if program is not None and self in program._nodes:
+            program._schedule = None
+            program._nodes_snapshot = None
+            node_type = self.__class__
+            nodes_by_type = program._nodes_by_type
+            level_counts = program._level_counts
             original_depth = self._attr_cache['_depth']
 
-            # remove the node from the tree's collections
+            # remove the node from the tree's collections, dropping 
+            # any types that are no longer used
             program._nodes.discard(self)
-            program._nodes_by_type[type(self)].discard(self)
-            program._level_counts[original_depth] -= 1
-
-            # remove any non-used keys
-            if not program._nodes_by_type[type(self)]:
-                program._nodes_by_type.pop(type(self))
-            if not program._level_counts[original_depth]:
-                program._level_counts.pop(original_depth)   
+            program._incomplete.discard(self)
+
+            bucket = nodes_by_type[node_type]
+            bucket.discard(self)
+            if not bucket:
+                del nodes_by_type[node_type]
+
+            level_counts[original_depth] -= 1
+            # drop empty levels from the bottom so the length of the 
+            # list is always the height of the tree
+            while level_counts and not level_counts[-1]:
+                level_counts.pop()
 
     def _rollback_detach(self):
         self._on_collect_descendants_detach()
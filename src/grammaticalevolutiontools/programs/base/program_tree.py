@@ -1,11 +1,12 @@
 from ..nodes.basic_nodes import NonTerminalNode, RootNode, ExecutableNode
 from .program_node import ProgramNode
+from ...meta import BaseNode
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import IntEnum
 import random
 
-from typing import Type, Union, Tuple, Set
+from typing import Type, Union, Tuple, Set, FrozenSet
     
     
 class ProgramTree:
@@ -17,6 +18,12 @@ class ProgramTree:
     state, its constituent nodes, and facilitates interactions
     with an optional :py:class:`~.agents.Agent`.
 
+    The node collections (:py:attr:`._nodes`, :py:attr:`._nodes_by_type`,
+    :py:attr:`._level_counts`, :py:attr:`._incomplete`) are kept up to date
+    incrementally: nodes register and unregister themselves as they are
+    attached to or detached from the tree, so structural edits never trigger
+    a full re-scan.
+
     Parameters
     ----------
     root : RootNode or Type[RootNode]
@@ -32,22 +39,23 @@ class ProgramTree:
         A set containing all unique :py:class:`~.nodes.ProgramNode` objects
         within the tree. This provides a fast lookup mechanism for any node
         in the program tree.
+    _nodes_snapshot : frozenset of ~.nodes.ProgramNode or None
+        A read-only copy of :py:attr:`._nodes` handed out by
+        :py:attr:`~.ProgramTree.nodes`. It is :py:obj:`None` if it must be
+        rebuilt after nodes are attached to or detached from the tree.
     _nodes_by_type : dict[type, set[~.nodes.ProgramNode]]
         A dictionary that organizes nodes by their type. Each key is a
         :py:class:`type` object (e.g., ``ConditionNode``, ``ActionNode``),
         and its corresponding value is a :py:class:`set` of all
         :py:class:`~.nodes.ProgramNode` instances of that specific type present
         in the tree. This facilitates quick access to nodes based on their class.
-    _nodes_dirty : bool
-        A flag indicating whether the internal node collections
-        (:py:attr:`._nodes`, :py:attr:`._nodes_by_type`) need to be
-        re-scanned and updated. This is typically set to :py:obj:`True`
-        after structural changes to the tree.
-    _max_child_depth : int or None
-        The maximum depth of the tree (number of levels below the root).
-        This value is calculated lazily, meaning it's computed only when
-        first requested after a potential change. It is :py:obj:`None`
-        if not yet calculated or if the tree is empty.
+    _level_counts : list of int
+        The number of nodes on each level of the tree, indexed by depth.
+        Empty levels are trimmed from the end, so its length is the
+        height of the tree.
+    _incomplete : set of ~.nodes.ProgramNode
+        The nodes of the tree that have fewer children than their
+        maximum number of children, i.e. those with open slots to fill.
     _agent : ~.agents.Agent or None
         The agent instance to which this program is attached, if any.
         If an agent is provided during initialization, this attribute
@@ -55,6 +63,17 @@ class ProgramTree:
     _program_stack : list of ~.nodes.ProgramNode
         An internal list used to manage the execution flow of the program.
         This acts as a call stack for program nodes during traversal or execution.
+    _schedule : list of ~.nodes.basic_nodes.ExecutableNode, bool, or None
+        The executable nodes of the program in the order they run, compiled
+        lazily by :py:meth:`~.ProgramTree._compile_schedule`. It is
+        :py:obj:`False` if the execution order depends on the program's
+        state, and :py:obj:`None` if it must be recompiled after the tree
+        structure changes.
+    _editable : bool
+        A cached copy of :py:meth:`~.ProgramTree.is_editable`, refreshed
+        whenever the program starts or stops running. Nodes read this flag
+        before falling back to the full :py:meth:`~.ProgramTree._assert_editable`
+        check, so edits to an idle tree cost a single attribute lookup.
 
     """
 
@@ -110,6 +129,9 @@ class ProgramTree:
         RUNNING = 1
         """The program is currently executing."""
 
+    __slots__ = ('_root', '_nodes', '_nodes_snapshot', '_nodes_by_type', '_level_counts', '_incomplete',
+                 '_program_stack', '_editable', '_schedule')
+
     # - - Initialization - - 
 
     def __init__(self, root: Union[RootNode, Type[RootNode]],
@@ -144,11 +166,14 @@ class ProgramTree:
         """
         self._root: 'RootNode' = None
         self._nodes: set['ProgramNode'] = set()
+        self._nodes_snapshot: frozenset['ProgramNode'] | None = None
         self._nodes_by_type: dict[type, set['ProgramNode']] = defaultdict(set)
-        self._level_counts = defaultdict(int)   # keeps track of how many nodes on each level
-        self._max_node_depth = -1
+        self._level_counts: list[int] = []     # keeps track of how many nodes on each level
+        self._incomplete: set['ProgramNode'] = set()
 
         self._program_stack: list['ProgramNode'] = []
+        self._editable: bool = True
+        self._schedule: list['ExecutableNode'] | bool | None = None
 
         self._verify_and_set_root(root)
         self._collect_nodes()
@@ -162,12 +187,15 @@ class ProgramTree:
 
     # - - Private Helpers - - 
 
-    def _cache_depth(self):
-        if not self._level_counts:
-            self._max_node_depth = -1
+    def _update_editable(self):
+        self._editable = self.is_editable()
+
+    def _update_incomplete(self, node: 'ProgramNode'):
+        # called when the children of a node in this tree change
+        if node._num_children < len(node._children):
+            self._incomplete.add(node)
         else:
-            self._max_node_depth = max(key for key in self._level_counts \
-                                        if self._level_counts[key] > 0)
+            self._incomplete.discard(node)
 
     def _collect_nodes(self):
         """Collects all nodes in the program tree and updates the internal node collections.
@@ -176,27 +204,67 @@ class ProgramTree:
         :py:attr:`~.ProgramTree._root` node to discover all connected nodes.
         It populates the :py:attr:`~.ProgramTree._nodes` set and
         :py:attr:`~.ProgramTree._nodes_by_type` dictionary. It also
-        calculates the maximum depth of the tree and stores it in
-        :py:attr:`~.ProgramTree._max_child_depth`.
+        counts the nodes on each level of the tree in
+        :py:attr:`~.ProgramTree._level_counts`.
 
-        This method is called lazily by properties and methods that rely on
-        up-to-date node collections (e.g., :py:meth:`~.ProgramTree.size`,
-        :py:meth:`~.ProgramTree.depth`, :py:meth:`~.ProgramTree.get_nodes_by_type`).
-        It only performs the collection if the :py:attr:`~.ProgramTree._nodes_dirty`
-        flag is :py:obj:`True`.
-
-        Returns
-        -------
-        set of ProgramNode
-            A set containing all :py:class:`~.nodes.ProgramNode` instances within the tree.
+        This full scan is only needed when the tree is created. Afterwards the
+        collections are updated incrementally as nodes are attached and
+        detached, so properties such as :py:attr:`~.ProgramTree.size` and
+        :py:attr:`~.ProgramTree.node_types` never re-scan the tree.
         """
         self._nodes.clear()
+        self._nodes_snapshot = None
         self._nodes_by_type.clear()
         self._level_counts.clear()
+        self._incomplete.clear()
 
         self._root._program = self
         self._root.collect_descendants(traversal_mode='attach')
-        self._cache_depth()
+
+    def _compile_schedule(self) -> list['ExecutableNode'] | bool:
+        """Flattens the program into the sequence of nodes it executes.
+
+        A program whose non-terminal nodes all have 
+        :py:attr:`~.nodes.basic_nodes.NonTerminalNode.STATIC_ORDER` set always
+        executes the same nodes in the same order, so a run can simply call
+        :py:meth:`~.nodes.basic_nodes.ExecutableNode.execute` on each node of
+        a pre-order walk.
+
+        Returns
+        -------
+        list of ExecutableNode or bool
+            The executable nodes in execution order, or :py:obj:`False` if the
+            program contains a node whose order is decided at run time, or a
+            node that is missing children.
+        """
+        schedule = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node._num_children < len(node._children):
+                return False
+            kind = node.NODE_KIND
+            if kind == ProgramNode.Kind.EXECUTABLE:
+                schedule.append(node)
+            elif kind == ProgramNode.Kind.NON_TERMINAL and node.STATIC_ORDER:
+                stack.extend(reversed(node._children))
+            else:
+                return False
+        
+        return schedule
+
+    def _run_schedule(self, schedule: list['ExecutableNode']):
+        # the program reports itself as running while the schedule executes,
+        # so nodes cannot be edited from within `execute`
+        self._assert_runnable()
+        self._program_stack.append(self._root)
+        self._editable = False
+        try:
+            for node in schedule:
+                node.execute()
+        finally:
+            self._program_stack.clear()
+            self._update_editable()
 
     def _fill_out_program(self):
         """Recursively fills out the program tree by adding random children to incomplete nodes.
@@ -207,44 +275,105 @@ class ProgramTree:
 
         Process:
         
-        1. Calls :py:meth:`~.ProgramTree._collect_nodes` to get all current nodes
-           and ensure node collections are up-to-date.
+        1. Reads the incomplete nodes from :py:attr:`~.ProgramTree._incomplete`, 
+           which is kept up-to-date as nodes and children are attached and 
+           detached, so the tree is not scanned for them.
 
-        2. Initializes a queue with all nodes that have fewer than their maximum
-           number of children.
+        2. Initializes a queue with those nodes.
 
         3. Enters a loop that continues as long as the queue is not empty:
 
            a. Dequeues a `curr_node`.
 
-           b. While `curr_node` still needs children:
+           b. For each empty child slot of `curr_node`:
 
-              i. Determines possible child node types and their probabilities
-                 using :py:meth:`~.nodes.ProgramNode.get_possible_children_and_probs`.
+              i. Determines possible child node types and an alias table for their
+                 probabilities using :py:meth:`~.nodes.ProgramNode.get_possible_children`,
+                 :py:meth:`~.nodes.ProgramNode.get_probs` and
+                 :py:meth:`~.nodes.ProgramNode.probs_to_alias_table`. These are built
+                 once per (node class, child index) and reused across calls, unless 
+                 the node class overrides :py:meth:`~.nodes.ProgramNode.get_possible_children`
+                 or :py:meth:`~.nodes.ProgramNode.get_probs`, or the node's own 
+                 possible children or probabilities were changed after it was 
+                 initialized.
 
-              ii. Randomly selects a `child_node_class`.
+              ii. Randomly selects a `child_node_class` from the alias table using
+                  a single call to :py:func:`random.random`.
 
               iii. Creates an instance of the `child_node_class`.
 
-              iv. Adds the new child to the queue (if it might need children too).
+              iv. Adds the new child to the queue if it needs children too.
 
-              v. Attaches the child to `curr_node` using :py:meth:`~.nodes.ProgramNode.add_child`.
-                 This action is expected to update node relationships and potentially
-                 signal the tree that its node collections are now dirty.
+           c. Attaches all of the new children to `curr_node` at once using 
+              :py:meth:`~.nodes.ProgramNode.set_children`. This action updates 
+              node relationships and registers the new children in the tree's 
+              node collections.
         """
-        queue = [node for node in self._nodes if node.num_children < node.max_num_children]
+        self._fill_from(*self._incomplete)
+
+    def _fill_from(self, *nodes: 'ProgramNode'):
+        """Fills out the branches below the given nodes with random children.
+
+        This is the worker behind :py:meth:`~.ProgramTree._fill_out_program`. 
+        Callers that know where the open slots are, such as 
+        :py:meth:`~.ProgramTree.replace_node`, pass those nodes directly 
+        instead of scanning the whole tree for incomplete nodes.
+
+        Parameters
+        ----------
+        *nodes : ProgramNode
+            The nodes of this tree to start filling from. Nodes that are
+            already complete are skipped over.
+        """
+        queue = deque(nodes)
+        rand = random.random
         
-        while len(queue) > 0:
-            curr_node: 'ProgramNode' = queue.pop(0)
-            while curr_node.num_children < curr_node.max_num_children:
-                for i, child in enumerate(curr_node._children):
-                    if not child:
-                        possible_children, probs = curr_node.get_possible_children_and_probs(i)
-                        child_node_class = random.choices(possible_children, probs, k=1)[0]
-                        child_node = child_node_class()
+        while queue:
+            curr_node: 'ProgramNode' = queue.popleft()
+            node_cls = type(curr_node)
+            if node_cls.get_possible_children is BaseNode.get_possible_children \
+                    and node_cls.get_probs is BaseNode.get_probs \
+                    and not getattr(curr_node, '_own_child_dist', False):
+                # (possible children, alias probabilities, aliases) by child
+                # index, kept on the class itself so subclasses get their own
+                tables = node_cls.__dict__.get('_ALIAS_TABLES')
+                if tables is None:
+                    tables = {}
+                    node_cls._ALIAS_TABLES = tables
+            else:
+                tables = {}
+            
+            new_children = [None] * len(curr_node._children)
+            filled = False
+            for i, child in enumerate(curr_node._children):
+                if child is not None:
+                    continue
+
+                table = tables.get(i)
+                if table is None:
+                    table = tables[i] = (tuple(curr_node.get_possible_children(i)), 
+                                         *BaseNode.probs_to_alias_table(curr_node.get_probs(i)))
+                possible_children, prob, alias = table
+
+                n = len(possible_children)
+                if n == 1:
+                    child_node_class = possible_children[0]
+                else:
+                    u = rand() * n
+                    j = int(u)
+                    child_node_class = possible_children[j if u - j < prob[j] else alias[j]]
+
+                child_node = child_node_class()
 
-                        queue.append(child_node)
-                        curr_node.add_child(child_node, index=i)
+                # terminal nodes never need filling out
+                if child_node._num_children < len(child_node._children):
+                    queue.append(child_node)
+                new_children[i] = child_node
+                filled = True
+
+            # one attach traversal for all of this node's new children
+            if filled:
+                curr_node.set_children(new_children)
 
 
     # - - Public Methods - - 
@@ -264,7 +393,10 @@ class ProgramTree:
             A set of all :py:class:`~.nodes.ProgramNode` instances of the specified type
             found within the program tree. If no nodes of the type exist, an empty set is returned.
         """
-        return self._nodes_by_type[node_type]
+        # `get` avoids the defaultdict inserting an empty bucket for
+        # types that are not in the tree
+        nodes = self._nodes_by_type.get(node_type)
+        return nodes if nodes is not None else set()
 
     def get_parent_of_node(self, node: 'ProgramNode') -> Tuple['ProgramNode', int]:
         """Retrieves the parent node and the child index of a given node within this tree.
@@ -292,7 +424,9 @@ class ProgramTree:
             If the provided `node` is the :py:attr:`~.ProgramTree._root` node,
             as the root has no parent.
         """
-        if node not in self.nodes:
+        # every attached node points back at its tree, so membership is an 
+        # identity check rather than a hash lookup in `_nodes`
+        if getattr(node, '_program', None) is not self:
             raise ValueError('Node does not exist in tree')
         
         return node.get_parent()
@@ -306,7 +440,8 @@ class ProgramTree:
         If `new_node` is set to :py:attr:`~.ProgramTree.RANDOM_REPLACEMENT`, the
         node will be conceptually "removed" (its slot becomes empty) and then
         subsequently filled in by a new complete randomly generated branch
-        during the call to :py:meth:`~.ProgramTree._fill_out_program`.
+        during the call to :py:meth:`~.ProgramTree._fill_from`. Only the
+        affected branch is filled out; the rest of the tree is not scanned.
 
         Parameters
         ----------
@@ -341,10 +476,20 @@ class ProgramTree:
         # if no replacement node specified, replace randomly
         if new_node is ProgramTree.RANDOM_REPLACEMENT:
             parent_node.pop_child(index)     # will get randomly replaced when tree is filled out
+            self._fill_from(parent_node)
         else:
             parent_node.replace_child(index, new_node)
 
-        self._fill_out_program()        # ensure program is complete
+            # only the new branch can have open slots
+            incomplete = []
+            stack = [new_node]
+            while stack:
+                curr_node = stack.pop()
+                if curr_node._num_children < len(curr_node._children):
+                    incomplete.append(curr_node)
+                stack.extend(child for child in curr_node._children 
+                             if child is not None)
+            self._fill_from(*incomplete)
 
 
     # - - Program Execution - - 
@@ -373,35 +518,33 @@ class ProgramTree:
         """
         self._assert_runnable()
 
-        # if stack empty, add root node
-        if self.status == ProgramTree.Status.EXITED:
-            self._program_stack.append(self._root)
+        # if stack empty, add root node. The stack is tested directly 
+        # rather than through the `status` property and an enum comparison.
+        stack = self._program_stack
+        if not stack:
+            stack.append(self._root)
             self._root.reset()
+            self._editable = False
 
-        while len(self._program_stack) > 0:
-            # get the next node to run. 
-            curr_node = self._program_stack[-1]
-            if curr_node.num_children < curr_node.max_num_children:
+        while stack:
+            # get the next node to run. Reads the slotted child storage
+            # directly; `_children` always has `max_num_children` entries
+            curr_node = stack[-1]
+            if curr_node._num_children < len(curr_node._children):
                 raise ProgramTree.NodeMissingChildError(
                     "Expected tree to be completely filled out, but "
                     "encountered node with missing children."
                     )
-            if isinstance(curr_node, ExecutableNode):
-                # run the node, then pop it off the stack
-                curr_node.execute()
-                self._program_stack.pop(-1)
+            # executable nodes run and end the tick, while non-terminal
+            # nodes push their next child or pop themselves off the stack
+            if curr_node._step(stack):
                 break
-            else:
-                curr_node: 'NonTerminalNode'
-                next_child = curr_node.get_next_child()
-                if next_child is None:
-                    # if no more children nodes to run, pop the 
-                    # current node off the stack
-                    self._program_stack.pop(-1)
-                else:
-                    self._program_stack.append(next_child)
+
+        if not stack:
+            self._update_editable()
+            return ProgramTree.Status.EXITED
                 
-        return self.status
+        return ProgramTree.Status.RUNNING
     
     def kill(self):
         """Immediately stops the execution of the program and resets its state.
@@ -413,13 +556,17 @@ class ProgramTree:
         """
         self._program_stack.clear()
         self._root.reset()
+        self._update_editable()
     
     def run(self, n=1):
         """Runs the program to completion `n` times.
 
         This method repeatedly calls :py:meth:`~.ProgramTree.tick` until the
         program reaches an :py:attr:`~.ProgramTree.Status.EXITED` state,
-        performing this cycle `n` times.
+        performing this cycle `n` times. Programs whose execution order is
+        fixed (see :py:attr:`~.nodes.basic_nodes.NonTerminalNode.STATIC_ORDER`)
+        are instead run from a schedule compiled once per tree structure, 
+        which executes the same nodes in the same order.
 
         Parameters
         ----------
@@ -435,6 +582,13 @@ class ProgramTree:
         """
         for _ in range(n):    
             # run the program through to completion n times
+            if not self._program_stack:
+                if self._schedule is None:
+                    self._schedule = self._compile_schedule()
+                if self._schedule is not False:
+                    self._run_schedule(self._schedule)
+                    continue
+
             while self.tick():
                 pass
 
@@ -447,7 +601,7 @@ class ProgramTree:
             :py:obj:`True` if the program's :py:attr:`~.ProgramTree.status` is
             :py:attr:`~.ProgramTree.Status.RUNNING`, :py:obj:`False` otherwise.
         """
-        return self.status == ProgramTree.Status.RUNNING
+        return bool(self._program_stack)
     
 
     # - - Special methods - - 
@@ -457,8 +611,7 @@ class ProgramTree:
 
         If a `type` is specified, the iterator will yield only nodes
         of that specific type. Otherwise, it iterates over all nodes
-        in the tree. The internal node collections are updated via
-        :py:meth:`~.ProgramTree._collect_nodes` before iteration if they are dirty.
+        in the tree.
 
         Parameters
         ----------
@@ -474,14 +627,11 @@ class ProgramTree:
         if not type:
             return iter(self._nodes)
         else:
-            return iter(self._nodes_by_type[type])
+            return iter(self._nodes_by_type.get(type, ()))
     
     def types_iter(self):
         """Returns an iterator over all unique node types present in the program tree.
 
-        The internal node collections are updated via
-        :py:meth:`~.ProgramTree._collect_nodes` before iteration if they are dirty.
-
         Returns
         -------
         iterator
@@ -517,9 +667,6 @@ class ProgramTree:
     def size(self) -> int:
         """The total number of nodes in the program tree.
 
-        The node collection is updated via :py:meth:`~.ProgramTree._collect_nodes`
-        if it is dirty before returning the size.
-
         Returns
         -------
         int
@@ -528,43 +675,41 @@ class ProgramTree:
         return len(self._nodes)
     
     @property
-    def nodes(self) -> Set['ProgramNode']:
+    def nodes(self) -> FrozenSet['ProgramNode']:
         """A set containing all nodes in the program tree.
 
-        This property provides access to a *copy* of the internal set of nodes
-        for inspection or iteration. Modifications to the returned set
-        will not affect the program tree's internal state.
-        The internal node collection is updated via :py:meth:`~.ProgramTree._collect_nodes`
-        if it is dirty before returning the set.
+        This property provides access to a read-only *copy* of the internal 
+        set of nodes for inspection or iteration. The copy is made once and 
+        reused until nodes are attached to or detached from the tree.
 
         Returns
         -------
-        set of ProgramNode
+        frozenset of ProgramNode
             A set of all :py:class:`~.nodes.ProgramNode` objects comprising the tree.
         """
-        return self._nodes.copy()
+        snapshot = self._nodes_snapshot
+        if snapshot is None:
+            snapshot = self._nodes_snapshot = frozenset(self._nodes)
+        return snapshot
     
     @property
     def node_types(self) -> Set[Type['ProgramNode']]:
         """A set containing all unique node types present in the program tree.
 
-        The internal node collections are updated via
-        :py:meth:`~.ProgramTree._collect_nodes` if they are dirty before returning.
-
         Returns
         -------
         set of type of ProgramNode
             A set of :py:class:`type` objects, representing the unique classes
             of :py:class:`~.nodes.ProgramNode` instances found within the tree.
         """
-        self._collect_nodes()
-        return set(self._nodes_by_type)   
+        return set(self._nodes_by_type)
     
     @property
     def height(self) -> int:
         """The number of levels in the program tree.
 
-        Calculated based on the :py:attr:`~.ProgramTree._max_child_depth`. 
+        Read from :py:attr:`~.ProgramTree._level_counts`, which has one entry
+        per level and is kept up to date as nodes are attached and detached.
         A tree with no nodes will a height of 0. A tree with only a root node 
         will have a height of 1. 
 
@@ -574,7 +719,7 @@ class ProgramTree:
             The number of levels in the tree. Returns 0 if the tree is considered empty
             (e.g., if no nodes were collected for some reason).
         """
-        return self._max_node_depth + 1
+        return len(self._level_counts)
     
     @property
     def status(self):
@@ -589,7 +734,7 @@ class ProgramTree:
             Either :py:attr:`~.ProgramTree.Status.RUNNING` if the program stack is not empty,
             or :py:attr:`~.ProgramTree.Status.EXITED` if the stack is empty.
         """
-        if len(self._program_stack) > 0:
+        if self._program_stack:
             return ProgramTree.Status.RUNNING
         else:
             return ProgramTree.Status.EXITED
@@ -2,13 +2,15 @@ from ....grammars import Grammar
 
 class GrammarProgramMeta(type):
     def __call__(cls, *args, **kwds):
-        if issubclass(cls, GrammarProgramAddin):
-            if cls._grammar is NotImplemented:
-                raise TypeError(
-                    "`GrammarProgramTree` subclasses must implement the "
-                    "`_grammar` class attribute before they can be "
-                    "instantiated."
-                    )
+        # every class built by this metaclass derives from GrammarProgramAddin,
+        # so only the grammar needs checking. It is checked per call since 
+        # `_grammar` may be assigned after the class is defined.
+        if cls._grammar is NotImplemented:
+            raise TypeError(
+                "`GrammarProgramTree` subclasses must implement the "
+                "`_grammar` class attribute before they can be "
+                "instantiated."
+                )
         
         return super().__call__(*args, **kwds)
 
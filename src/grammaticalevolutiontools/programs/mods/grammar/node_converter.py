@@ -2,11 +2,32 @@ from ....grammars.grammar_node import GrammarNode
 from ...base import ProgramNode
 from ....meta.meta import InheritingNodeMeta
 
-from typing import Type
+from types import MemberDescriptorType
+from typing import Type, Any
 
 
 _custom_attribute_cache: dict[type, list[str]] = {}
 
+
+def _get_instance_attributes(obj) -> dict[str, Any]:
+    # Collects the attributes currently set on obj, including those stored
+    # in __slots__ (which do not show up in obj.__dict__)
+    attributes = {}
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f"_{cls.__name__.lstrip('_')}{name}"
+            if hasattr(obj, name):
+                attributes[name] = getattr(obj, name)
+
+    attributes.update(getattr(obj, '__dict__', {}))
+    return attributes
+
 # Decorator: Converts a ProgramNode subclass into a GrammarNode class
 def as_grammar_node(node_cls: Type[ProgramNode]):
 
@@ -38,6 +59,7 @@ def as_grammar_node(node_cls: Type[ProgramNode]):
 
     # These are methods the user is allowed to override
     overridable_methods = {"add_child",
+                           "set_children",
                            "pop_child",
                            "replace_child",
                            "remove_all_children",
@@ -70,11 +92,11 @@ def as_grammar_node(node_cls: Type[ProgramNode]):
             if node_cls not in _custom_attribute_cache:
                 _custom_attribute_cache[node_cls] = []
                 
-                old_self_dict = self.__dict__.copy()
+                old_attributes = _get_instance_attributes(self)
 
                 super()._custom_init()
-                for key in self.__dict__:
-                    if key not in old_self_dict:
+                for key in _get_instance_attributes(self):
+                    if key not in old_attributes:
                         _custom_attribute_cache[node_cls].append(key)
 
             else:
@@ -103,7 +125,7 @@ def as_grammar_node(node_cls: Type[ProgramNode]):
             # copies attributes set by _custom_init to this instance
             new_attributes = {}
             for attr in _custom_attribute_cache[node_cls]:
-                new_attributes[attr] = attr_generator.__dict__[attr]
+                new_attributes[attr] = getattr(attr_generator, attr)
 
             return new_attributes
 
@@ -112,7 +134,8 @@ def as_grammar_node(node_cls: Type[ProgramNode]):
 
             # copy the behavior of _custom_init from the original node class
             custom_attributes = self._extract_custom_behavior()
-            self.__dict__.update(custom_attributes)
+            for attr, val in custom_attributes.items():
+                setattr(self, attr, val)
                 
 
     # Copy over class methods and properties
@@ -126,6 +149,12 @@ def as_grammar_node(node_cls: Type[ProgramNode]):
                                      "conflict with GrammarNode attributes.\n"
                                      f"Attribute at fault: {attr_name}")
             
+            # Slot descriptors only apply to instances of the original
+            # class, so slotted attributes live in the new instance's __dict__
+            if attr_name == '__slots__' \
+                    or isinstance(src_attr, MemberDescriptorType):
+                continue
+
             # Conflicting methods are simply not copied over, 
             # unless listed in overridable_methods. 
             if attr_name in methods_to_exclude \
@@ -3,12 +3,24 @@ from .terminal_node import TerminalNode
 from abc import abstractmethod
 
 class ExecutableNode(TerminalNode):
+
+    __slots__ = ()
+
+    NODE_KIND = TerminalNode.Kind.EXECUTABLE
+
     def _base_node_init(self, token: str):
         super()._base_node_init(token)
 
     def _custom_init(self):
         return super()._custom_init()
 
+    def _step(self, program_stack: list) -> bool:
+        # runs this node as one step of ProgramTree.tick, then pops
+        # it off the stack. Returns True since the tick is complete.
+        self.execute()
+        program_stack.pop()
+        return True
+
     @abstractmethod
     def execute(self):
         pass
\ No newline at end of file
@@ -8,6 +8,25 @@ class NonTerminalNode(ProgramNode):
     Abstract class
     """
 
+    __slots__ = ('_curr_child',)
+
+    NODE_KIND = ProgramNode.Kind.NON_TERMINAL
+
+    STATIC_ORDER: bool = False
+    """Whether :py:meth:`get_next_child` always visits every child once, in 
+    index order. Programs built only from such nodes and executable nodes 
+    are run from a precompiled schedule. Subclasses that override 
+    :py:meth:`get_next_child` without setting this themselves have it reset 
+    to :py:obj:`False` (see :py:meth:`__init_subclass__`).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # an inherited STATIC_ORDER describes the parent's get_next_child, 
+        # not an override of it
+        if 'get_next_child' in cls.__dict__ and 'STATIC_ORDER' not in cls.__dict__:
+            cls.STATIC_ORDER = False
+
     def _base_node_init(self, token: str, 
                         is_root: bool, num_children: int, 
                         possible_children: dict[int, list[Type[ProgramNode]]],
@@ -29,18 +48,38 @@ class NonTerminalNode(ProgramNode):
         return super()._custom_init() 
     
     def _assert_editable(self):
-        ProgramNode._assert_editable(self)
+        # inlines ProgramNode._assert_editable and is_running: both tests
+        # are plain attribute reads on the program's cached flag and on
+        # `_curr_child`, so the common case makes no further calls
+        program = self._program
+        if program is not None and not program._editable:
+            program._assert_editable()
 
-        if self.is_running():
+        if self._curr_child > -1:
             raise RuntimeError(
                 'Cannot modify children while this node is still running. '
                 'Please reset th node first.'
             )
 
     def reset(self):
+        # an idle node can have no running children (see get_next_child),
+        # which is the common case, so there is nothing to walk
+        if self._curr_child < 0:
+            return
+        
+        # walks the running branch with an explicit stack so deep
+        # programs don't recurse once per level. Each node's own state
+        # is cleared during the same walk.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            stack.extend(node._running_children())
+            node._reset_state()
+
+    def _reset_state(self):
+        # clears the execution state of this node alone. Subclasses that
+        # track more state between calls to get_next_child extend this.
         self._curr_child = -1
-        for child in self.running_children:
-            child.reset()
     
     def remove_all_children(self):
         # if node not attached to program or program not running, 
@@ -53,14 +92,54 @@ class NonTerminalNode(ProgramNode):
     def is_running(self):
         return self._curr_child > -1
     
+    def _step(self, program_stack: list) -> bool:
+        # advances this node as part of ProgramTree.tick, pushing the next
+        # child to run or popping this node once it has finished
+        next_child = self.get_next_child()
+        if next_child is None:
+            program_stack.pop()
+        else:
+            program_stack.append(next_child)
+        return False
+    
     # - - - -
     
     @property
     def running_children(self):
-        return [child for child in self.children \
-                if isinstance(child, NonTerminalNode) and child.is_running()]
+        return self._running_children()
+    
+    def _running_children(self) -> list['NonTerminalNode']:
+        # the child handed out by the last call to get_next_child (at index
+        # `_curr_child`) is the only one that can still be running, so 
+        # there is no need to scan every child. A plain method, so internal 
+        # callers skip the property lookup.
+        non_terminal = ProgramNode.Kind.NON_TERMINAL
+        curr_child = self._curr_child
+        children = self._children
+        if 0 <= curr_child < len(children):
+            child = children[curr_child]
+            if child is not None and child.NODE_KIND == non_terminal \
+                    and child._curr_child > -1:
+                return [child]
+            return []
+        
+        # `_curr_child` is not a child index (idle, or a subclass that uses 
+        # it for its own bookkeeping), so fall back to checking every child
+        return [child for child in children \
+                if child is not None and child.NODE_KIND == non_terminal \
+                    and child._curr_child > -1]
     
     @abstractmethod
     def get_next_child(self):
+        """Returns the next child to run, or :py:obj:`None` once this node 
+        has finished.
+
+        Implementations keep :py:attr:`_curr_child` above -1 exactly while 
+        this node is running, and set it back to -1 when they return 
+        :py:obj:`None`. While running, it should hold the index of the child 
+        that was just returned: :py:attr:`running_children` and 
+        :py:meth:`reset` only look at that child when it is a valid index, 
+        and check every child otherwise.
+        """
         raise NotImplementedError('get_next_child not implemented.')
     
@@ -7,6 +7,10 @@ if TYPE_CHECKING:
 
 class RootNode(NonTerminalNode):    
 
+    __slots__ = ()
+
+    STATIC_ORDER = True
+
     def _base_node_init(self, token: str, 
                         possible_children: list[type],
                         child_probs: list[float] = None, 
@@ -27,11 +31,9 @@ class RootNode(NonTerminalNode):
     # - - - -
 
     def get_next_child(self):
-        if self._curr_child < 0:
-            self._curr_child = 0
-            return self.children[0]
-        else:
-            self._curr_child = -1
-            return None
+        # `_curr_child` only ever alternates between -1 and 0 here, 
+        # so flip it with ~ instead of comparing first
+        curr_child = self._curr_child = ~self._curr_child
+        return None if curr_child else self._children[0]
 
     
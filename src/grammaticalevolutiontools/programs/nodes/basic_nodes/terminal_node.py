@@ -1,6 +1,9 @@
 from ...base.program_node import ProgramNode
 
 class TerminalNode(ProgramNode):
+
+    __slots__ = ()
+
     def _base_node_init(self, token: str):
         super()._base_node_init(
             token,
@@ -1,6 +1,9 @@
 from ..basic_nodes import TerminalNode
 
 class FactorNode(TerminalNode):
+
+    __slots__ = ('_val', '_str', '_repr')
+
     def _assert_val_is_valid(self, val):
         pass
 
@@ -12,13 +15,18 @@ class FactorNode(TerminalNode):
         self._assert_val_is_valid(val)
         self._val = val
 
+        # the value never changes after construction, so it is converted 
+        # to a string once here and every other string form reuses that
+        self._str = str(val)
+        self._repr = f'<Factor: {self._str}>'
+
         super()._custom_init()
 
     def __init__(self):
         self._base_node_init()
         self._custom_init()
 
-        self._token = f"<{self._token}: {self._val}>"
+        self._token = f"<{self._token}: {self._str}>"
 
     @property
     def value(self):
@@ -28,7 +36,7 @@ class FactorNode(TerminalNode):
         return self._val
     
     def __str__(self):
-        return str(self._val)
+        return self._str
     
     def __repr__(self):
-        return f'<Factor: {self._val}>'
\ No newline at end of file
+        return self._repr
\ No newline at end of file
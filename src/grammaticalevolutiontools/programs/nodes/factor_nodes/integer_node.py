@@ -3,7 +3,13 @@ from .number_node import NumberNode
 from numbers import Integral
 
 class IntegerNode(NumberNode):
+
+    __slots__ = ()
+
     def _assert_val_is_valid(self, val):
+        # the ABC instance check is slow, so let plain ints skip it
+        if type(val) is int:
+            return
         if not isinstance(val, Integral):
             raise TypeError("Value in an IntegerNode must be "
                             "of type Integral. Found val of type "
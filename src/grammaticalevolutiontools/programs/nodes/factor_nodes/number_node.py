@@ -2,8 +2,16 @@ from .factor_node import FactorNode
 
 from numbers import Number
 
+_BUILTIN_NUMBERS = (int, float)
+
 class NumberNode(FactorNode):
+
+    __slots__ = ()
+
     def _assert_val_is_valid(self, val):
+        # the ABC instance check is slow, so let builtin numbers skip it
+        if type(val) in _BUILTIN_NUMBERS:
+            return
         if not isinstance(val, Number):
             raise TypeError("Value in a NumberNode must be of type Number. "
                             f"Found val of type {type(val).__name__}")
@@ -1,12 +1,28 @@
+from ...base.program_node import ProgramNode
 from .integer_node import IntegerNode
 
 import random
 
 class RandIntegerNode(IntegerNode):
+
+    __slots__ = ()
+
     def _base_node_init(self, custom_token=None):
         token = "RandInt" if custom_token is None else custom_token
         super()._base_node_init(token)
 
     def _custom_init(self, a, b):
-        num = random.randint(a, b)
-        super()._custom_init(num)
+        n = b - a + 1
+        if n > 0 and n & (n - 1) == 0:
+            # a power-of-two range needs no rejection sampling
+            num = a + random.getrandbits(n.bit_length() - 1)
+        else:
+            # raises ValueError for an empty range, as randint does
+            num = random.randrange(a, b + 1)
+
+        # the drawn value is always an int, so the validation done along the
+        # IntegerNode -> FactorNode chain is skipped and its state set here
+        self._val = num
+        self._str = str(num)
+        self._repr = f'<Factor: {self._str}>'
+        ProgramNode._custom_init(self)
@@ -4,12 +4,15 @@ from ..factor_nodes import FactorNode
 
 from abc import abstractmethod
 from typing import Type, Optional
+import sys
 
 Probabilities = list[float]
 FactorList = list[list[Type[FactorNode]]]
 
 class ConditionNode(NonTerminalNode):
 
+    __slots__ = ('_factor_inds',)
+
     TRUE_IND = 0
     FALSE_IND = 1
 
@@ -51,13 +54,14 @@ class ConditionNode(NonTerminalNode):
                             f"of factors. Num factors found: {num_factors}. "
                             f"Num names provided: {len(factor_names)} ")
 
+        # names are interned so lookups with literal names in condition()
+        # match the stored keys by identity
         self._factor_inds: dict[str, int] = {}
-        used = set()
         for i, factor in enumerate(factor_names, start=2):
-            if factor in used:
+            if factor in self._factor_inds:
                 raise ValueError("Same factor name used twice. "
                                 f"Value at fault: '{factor}'")
-            self._factor_inds[factor] = i
+            self._factor_inds[sys.intern(factor)] = i
                 
         super()._custom_init()
 
@@ -65,20 +69,23 @@ class ConditionNode(NonTerminalNode):
         return self._factor_inds[factor]
     
     def _get_factor(self, factor: str) -> FactorNode:
-        return self._children[self._get_factor_ind(factor)]
+        return self._children[self._factor_inds[factor]]
+    
+    def _get_factor_at(self, position: int) -> FactorNode:
+        # positional access for conditions that know their factor order, 
+        # skipping the name lookup. Factors follow the two branch children.
+        return self._children[position + 2]
     
     def get_next_child(self):
         if self._curr_child > -1:
             self._curr_child = -1
             return None
+        elif self.condition():
+            self._curr_child = 0
+            return self._children[0]
         else:
-            child_if_true, child_if_false = self.children[:2]
-            if self.condition():
-                self._curr_child = 0
-                return child_if_true
-            else:
-                self._curr_child = 1
-                return child_if_false
+            self._curr_child = 1
+            return self._children[1]
             
     @abstractmethod
     def condition(self) -> bool:
@@ -3,6 +3,9 @@ from ..basic_nodes import NonTerminalNode
 from ..factor_nodes import IntegerNode
 
 class RepeatNode(NonTerminalNode):
+
+    __slots__ = ('_count',)
+
     def _base_node_init(
             self, 
             possible_numbers:list[IntegerNode], 
@@ -21,20 +24,25 @@ class RepeatNode(NonTerminalNode):
         super()._custom_init()
         self._count = 0
 
+    def _reset_state(self):
+        super()._reset_state()
+        self._count = 0
+
     @property
     def num_repeats(self):
-        number = self.children[0]
+        number = self._children[0]
         if number is None:
             raise RuntimeError('This node does not have its number of repeats defined. Please add a NumberNode containing the number of repeats to child index 0.')
         
-        return number()
+        return number._val
     
     def get_next_child(self):
-        num_reps = self.num_repeats()
-        if self._count < num_reps:
+        # read the count straight off the factor rather than going through
+        # its __call__, which would cost an extra frame every repetition
+        if self._count < self._children[0]._val:
             self._curr_child = 1
             self._count += 1
-            return self.children[1]
+            return self._children[1]
         else:
             self._curr_child = -1
             self._count = 0
@@ -42,5 +50,6 @@ class RepeatNode(NonTerminalNode):
         
 
     def __str__(self):
-        _str = f"{self.token}({self.children[1]}, {self.num_repeats})"
+        _str = f"{self.token}({self._children[1]}, {self.num_repeats})"
+        return _str
         
\ No newline at end of file
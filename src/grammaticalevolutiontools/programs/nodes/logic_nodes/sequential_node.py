@@ -5,6 +5,11 @@ from typing import Union, Type
 import warnings
 
 class SequentialNode(NonTerminalNode):
+
+    __slots__ = ()
+
+    STATIC_ORDER = True
+
     def _base_node_init(
             self, token: str, 
             num_children: int, 
@@ -42,11 +47,12 @@ class SequentialNode(NonTerminalNode):
                                 label=label)
 
     def get_next_child(self):
-        if self._curr_child == self.num_children - 1:
-            self._curr_child = -1
-        else:
-            self._curr_child += 1
-        
-        return self.children[self._curr_child] if self._curr_child > -1 else None
-            
-    
\ No newline at end of file
+        # `_num_children` is already kept up to date by add/pop, so it 
+        # serves as the bound without a separate last-index attribute
+        next_child = self._curr_child + 1
+        if next_child < self._num_children:
+            self._curr_child = next_child
+            return self._children[next_child]
+
+        self._curr_child = -1
+        return None
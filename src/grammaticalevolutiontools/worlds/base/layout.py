@@ -2,6 +2,7 @@ from .objects import WorldObject
 
 from abc import ABC, abstractmethod
 from typing import Self
+import weakref
 
 
 class WorldLayout(ABC):
@@ -21,6 +22,9 @@ class WorldLayout(ABC):
         def __init__(self, msg: str):
             super(WorldLayout.AlreadyInitializedError, self).__init__(msg)
 
+    # classes already checked by _assert_valid_obj_class
+    _valid_obj_classes: 'weakref.WeakSet[type]' = weakref.WeakSet()
+
     def __init__(self):
         self._locked = False
 
@@ -43,8 +47,13 @@ class WorldLayout(ABC):
             raise WorldLayout.LayoutLockedError(msg)
         
     def _assert_valid_obj_class(self, obj_class: type):
-        if not isinstance(obj_class, type) or not issubclass(obj_class, WorldObject):
+        if not isinstance(obj_class, type):
+            raise TypeError('Provided class not an instance of GrammaticalEvolutionTools.World.Objects.WorldObject')
+        if obj_class in WorldLayout._valid_obj_classes:
+            return
+        if not issubclass(obj_class, WorldObject):
             raise TypeError('Provided class not an instance of GrammaticalEvolutionTools.World.Objects.WorldObject')
+        WorldLayout._valid_obj_classes.add(obj_class)
         
     # - - - - 
 
@@ -29,6 +29,11 @@ class RewardObjectMixin(ABC):
         base_yield (float): Read-only. The standard amount yielded 
             per interaction.
     """
+    # Python can't combine two bases that both lay out slots, so the mixin 
+    # declares none. Concrete rewards that use slots list `_remaining_amount` 
+    # and `_base_yield` in their own `__slots__` (see GridWorldReward).
+    __slots__ = ()
+
     def __init__(self, total_amount: numbers.Real, base_yield: numbers.Real):
         """
         Initializes the Reward instance.
@@ -78,9 +83,13 @@ class RewardObjectMixin(ABC):
         Returns:
             float: The actual amount given (accounting for exhaustion).
         """
-        _yield = min(self._base_yield, self._remaining_amount)
+        _remaining = self._remaining_amount
+        _base_yield = self._base_yield
+        _yield = _base_yield if _base_yield < _remaining else _remaining
         agent.give_reward(_yield)
-        self._remaining_amount -= _yield
+        self._remaining_amount = _remaining - _yield
+
+        return _yield
 
     @property
     def remaining(self) -> float:
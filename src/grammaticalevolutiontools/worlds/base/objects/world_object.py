@@ -22,7 +22,9 @@ class WorldObject(ABC):
         world (World): A read-only property returning the :class:`World` 
             instance this object belongs to.
     """
-    _world_cls = None
+    __slots__ = ('_world',)
+
+    _world_cls = None       # set to World once world.py is imported
 
     def __init__(self, world:'World'):
         """
@@ -35,11 +37,8 @@ class WorldObject(ABC):
             TypeError: If the provided ``world`` is not an instance of 
                 the expected :class:`World` class.
         """
-        if self._world_cls is None:
-            from ..world import World
-            self._world_cls = World
-        
-        if not isinstance(world, self._world_cls):
+        world_cls = WorldObject._world_cls
+        if type(world) is not world_cls and not isinstance(world, world_cls):
             raise TypeError('world must be an instance of World class')
     
         self._world: 'World' = world
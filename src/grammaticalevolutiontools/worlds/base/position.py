@@ -4,19 +4,42 @@ from numbers import Real
 import numpy as np
 
 
+def _numpy_kinds_for(dtype: type) -> str:
+    # numpy dtype kinds whose scalars are all instances of `dtype`
+    return ''.join(kind for kind, scalar_type in (('i', np.int64), ('u', np.uint64), ('f', np.float64))
+                   if issubclass(scalar_type, dtype))
+
+
 class WorldPosition(Sequence):
 
+    __slots__ = ('_coords', '_coords_arr')
+
     __array_priority__ = 10     # for predence with __eq__ with numpy arrays on the left side of ==
     _required_length: int | None = None
     _dtype = Real
+    _array_kinds = _numpy_kinds_for(Real)      # set per subclass from `_dtype`
 
     def __init__(self, coords: Sequence):
-        if self._required_length is None:
-            raise TypeError("Can not instantiate a WorldPosition subclass without "
-                            "defining `_required_length` class method")
+        if type(coords) is type(self):
+            # positions are immutable, so their coordinates can be shared
+            self._coords = coords._coords
+            self._coords_arr = coords._coords_arr
+            return
         
-        self._assert_coords_valid(coords)
-        self._coords = tuple(int(i) for i in coords)
+        if type(coords) is tuple and len(coords) == self._required_length \
+                and all(type(i) is int for i in coords):
+            # a tuple of plain ints of the right length is already valid
+            self._coords = coords
+        else:
+            if self._required_length is None:
+                raise TypeError("Can not instantiate a WorldPosition subclass without "
+                                "defining `_required_length` class method")
+            
+            self._assert_coords_valid(coords)
+            self._coords = tuple(int(i) for i in coords)
+
+        self._coords_arr = np.asarray(self._coords, dtype=np.int64)
+        self._coords_arr.flags.writeable = False
 
         super().__init__()
 
@@ -24,6 +47,17 @@ class WorldPosition(Sequence):
         super().__init_subclass__()
         if (cls._required_length is not None) and (not isinstance(cls._required_length, cls._dtype)):
             raise TypeError("`_required_length` must be an integer")
+        cls._array_kinds = _numpy_kinds_for(cls._dtype)
+
+    @classmethod
+    def _unchecked(cls, coords: tuple[int, ...]):
+        # builds a position from a tuple of ints already known to be valid,
+        # skipping the checks in __init__
+        obj = object.__new__(cls)
+        obj._coords = coords
+        obj._coords_arr = np.asarray(coords, dtype=np.int64)
+        obj._coords_arr.flags.writeable = False
+        return obj
 
     def _is_array_like(self, obj):
         if isinstance(obj, np.ndarray):
@@ -40,6 +74,10 @@ class WorldPosition(Sequence):
                 f"{type(self).__name__} requires coords of length {self._required_length}. "
                 f"Found object of length {len(coords)}"
                 )
+        if isinstance(coords, np.ndarray) and coords.ndim == 1 \
+                and coords.dtype.kind in self._array_kinds:
+            # every element of an array shares its dtype, checked once
+            return
         if not all(isinstance(x, self._dtype) for x in coords):
             raise ValueError(
                 f"all element of `coords` must be of type {self._dtype.__name__}"
@@ -47,9 +85,13 @@ class WorldPosition(Sequence):
         
     @property
     def coords(self):
-        return np.array(self)        
+        # positions are immutable, so the same read-only array is shared
+        return self._coords_arr
     
     def __eq__(self, other):
+        if type(other) is type(self):
+            return self._coords == other._coords
+        
         try:
             _other = type(self)(other)
         except (ValueError, TypeError) as ex:
@@ -61,6 +103,12 @@ class WorldPosition(Sequence):
         return iter(self._coords)
     
     def __add__(self, other):
+        if type(other) is type(self):
+            return self._unchecked(tuple(a + b for a, b in zip(self._coords, other._coords)))
+        if type(other) is tuple and len(other) == len(self._coords) \
+                and all(type(x) is int for x in other):
+            return self._unchecked(tuple(a + b for a, b in zip(self._coords, other)))
+        
         _other = np.array(other)
 
         try:
@@ -74,10 +122,15 @@ class WorldPosition(Sequence):
         return self + other
     
     def __getitem__(self, index):
-        return self.coords[index]
+        # plain ints for single coordinates, arrays for slices and fancy indexing
+        if isinstance(index, int):
+            return self._coords[index]
+        return self._coords_arr[index]
     
-    def __array__(self):
-        return np.array(self._coords)
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None:
+            return self._coords_arr.astype(dtype)
+        return self._coords_arr.copy() if copy else self._coords_arr
     
     def __repr__(self):
         return str(self)
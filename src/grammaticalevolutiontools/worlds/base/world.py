@@ -55,7 +55,7 @@ class World[A: Agent, L: WorldLayout, O: WorldObject](ABC):         # generics f
     @classmethod
     def _assert_layout_valid(cls, layout):
         if not isinstance(layout, cls._layout_class):
-            raise TypeError(f"Layout must be an instance of {cls._min_layout_class.__name__}")
+            raise TypeError(f"Layout must be an instance of {cls._layout_class.__name__}")
         cls._assert_layout_locked(layout)
 
     @classmethod
@@ -77,40 +77,44 @@ class World[A: Agent, L: WorldLayout, O: WorldObject](ABC):         # generics f
         
 
     # - - Instance Methods - - 
+
+    __slots__ = ('_layout', '_agents', '_objects')
     
     def __init__(self, layout: L): 
         self._assert_layout_valid(layout)
         self._layout: L = layout
 
-        self._agents: set[A] = set()
-        self._objects: set[O] = set()
+        # dicts used as insertion-ordered sets, so agents tick (and objects
+        # are listed) in the order they were added
+        self._agents: dict[A, None] = {}
+        self._objects: dict[O, None] = {}
 
     def add_agent(self, agent: A) -> Self:
         self._assert_agent_valid(agent)
-        self._agents.add(agent)
+        self._agents[agent] = None
         agent._set_world(self)
         agent.reset()
         return self
 
     def add_object(self, object: O) -> Self:
         self._assert_object_valid(object)
-        self._objects.add(object)
+        self._objects[object] = None
         return self
 
     def remove_agent(self, agent: A) -> Self:
-        self._agents.remove(agent)
+        del self._agents[agent]
         agent._clear_world()
         return self
 
     def remove_object(self, object: O) -> Self:
-        self._objects.remove(object)
+        del self._objects[object]
         return self
 
     def get_all_agents(self):
-        return self._agents.copy()
+        return set(self._agents)
     
     def get_all_objects(self):
-        return self._objects.copy()
+        return set(self._objects)
     
     def clear_agents(self) -> Self:
         for agent in self._agents:
@@ -139,4 +143,8 @@ class World[A: Agent, L: WorldLayout, O: WorldObject](ABC):         # generics f
     @abstractmethod
     def tick(self):
         pass
-    
\ No newline at end of file
+
+
+# world.py imports objects, so objects cannot import World at module level.
+# Resolve it here once instead of on every WorldObject construction.
+WorldObject._world_cls = World
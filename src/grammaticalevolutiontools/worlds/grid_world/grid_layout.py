@@ -28,6 +28,8 @@ class GridLayout(WorldLayout):
         self.__height: int = None
 
         self.__object_positions: dict[GridPosition, Type[GridWorldObject]]
+        self.__position_array: np.ndarray | None = None
+        self.__position_list: list[GridPosition] | None = None
 
     def initialized(self) -> bool:
         return self.__width is not None and self.__height is not None
@@ -51,6 +53,34 @@ class GridLayout(WorldLayout):
         _pos = GridPosition(pos)
         return _pos in self.__object_positions
     
+    def _get_position_array(self) -> np.ndarray:
+        # (N, 2) array of object positions, rows in the same order as 
+        # self.__object_positions. Rebuilt lazily after the layout changes, 
+        # along with the list of positions its rows index into.
+        if self.__position_array is None:
+            self.__position_list = list(self.__object_positions)
+            _arr = np.array([pos._coords for pos in self.__position_list], 
+                            dtype=np.int64).reshape(-1, 2)
+            _arr.flags.writeable = False
+            self.__position_array = _arr
+        return self.__position_array
+    
+    def positions_near(self, pos: GridPosition, radius: int) -> list[GridPosition]:
+        """
+        Finds all object positions within a given Manhattan distance of a position.
+
+        Arguments:
+            pos (Position): A Position object (or equivalent) to search around.
+            radius (int): The maximum Manhattan distance from `pos` to include.
+
+        Returns:
+            list[GridPosition]: The positions of all objects in the layout within `radius` of `pos`.
+        """
+        _pos = GridPosition(pos)
+        _dists = np.abs(self._get_position_array() - _pos.coords).sum(axis=1)
+        _positions = self.__position_list
+        return [_positions[i] for i in np.flatnonzero(_dists <= radius)]
+    
     # -- Assertions --
 
     def _assert_initialized(self, msg='Cannot modify objects until width and height are set.'):
@@ -110,6 +140,8 @@ class GridLayout(WorldLayout):
 
         _pos = GridPosition(pos)
         self.__object_positions[_pos] = obj_class
+        self.__position_array = None
+        self.__position_list = None
 
         return self
     
@@ -1,8 +1,52 @@
 from ..base import WorldPosition
 
 from numbers import Integral
+from typing import Self
 
 # Coordinates for a standard 2D Grid World
 class GridPosition(WorldPosition):
+    __slots__ = ()
     _required_length = 2
     _dtype = Integral
+
+    # shared instance for each pair of coordinates, see `intern`
+    _interned: dict[tuple[int, int], 'GridPosition'] = {}
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        cls._interned = {}
+
+    @classmethod
+    def intern(cls, pos) -> Self:
+        """
+        Returns the shared position with the same coordinates as `pos`.
+
+        Positions are immutable, so a single instance can stand for a pair 
+        of coordinates wherever it is used. GridWorld interns the positions 
+        it stores, so agents moving back and forth reuse existing positions 
+        instead of building new ones.
+
+        Arguments:
+            pos (GridPosition): A GridPosition or an equivalent pair of 
+                integer coordinates.
+
+        Returns:
+            GridPosition: The shared position for those coordinates.
+        """
+        _pos = pos if type(pos) is cls else cls(pos)
+        return cls._interned.setdefault(_pos._coords, _pos)
+    
+    @classmethod
+    def _intern_unchecked(cls, coords: tuple[int, int]) -> Self:
+        # `intern` for a tuple of ints already known to be valid
+        _pos = cls._interned.get(coords)
+        if _pos is None:
+            _pos = cls._interned[coords] = cls._unchecked(coords)
+        return _pos
+
+    def _assert_coords_valid(self, coords):
+        # a list or tuple of two plain ints is always valid
+        if type(coords) in (list, tuple) and len(coords) == 2 \
+                and type(coords[0]) is int and type(coords[1]) is int:
+            return
+        super()._assert_coords_valid(coords)
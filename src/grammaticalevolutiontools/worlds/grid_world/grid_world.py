@@ -5,8 +5,7 @@ from .grid_world_object import GridWorldObject
 from ..base.world import World
 from .grid_world_animation import GridWorldAnimation, Color
 
-from collections import defaultdict
-from typing import Type, Tuple, List
+from typing import Type, Tuple, List, Callable
 
 
 AgentStartState = Tuple[GridPosition, GridWorldAgent.Direction]
@@ -40,6 +39,12 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
     _min_obj_class = GridWorldObject
     _layout_class = GridLayout
 
+    __slots__ = ('_agents_can_share_spaces', '_agents_wrap_around', 
+                 '_height', '_width', '_agent_grid', '_obj_grid', '_impassable', 
+                 '_occupied', '_agent_trace', '_obj_trace', 
+                 '_agents_changed', '_objs_changed', '_recording',
+                 '_agent_ticks')
+
 
     def __init__(self, layout: GridLayout, agents_can_share_spaces:bool=False, 
                  agents_wrap_around=False):
@@ -66,8 +71,17 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         self._agents_can_share_spaces: bool = agents_can_share_spaces
         self._agents_wrap_around = agents_wrap_around
 
-        self._agent_positions: dict[GridPosition, set[A]] = defaultdict(set)
-        self._object_positions: dict[GridPosition, list[O]] = defaultdict(list)
+        # Per-cell state, indexed by row * width + col (see `_cell`). The 
+        # grids hold None until something is placed in a cell, and the set of 
+        # agents / list of objects afterwards. The flags are 1 where a cell 
+        # holds an impassable object / at least one agent.
+        self._height: int = layout.height
+        self._width: int = layout.width
+        _num_cells = self._height * self._width
+        self._agent_grid: list[set[A] | None] = [None] * _num_cells
+        self._obj_grid: list[list[O] | None] = [None] * _num_cells
+        self._impassable = bytearray(_num_cells)
+        self._occupied = bytearray(_num_cells)
 
         self._agent_trace: GridWorld.AgentTrace = []
         self._obj_trace: GridWorld.ObjTrace = []
@@ -77,6 +91,10 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
 
         self._recording: bool = False
 
+        # bound tick methods of the agents, in tick order. None when agents 
+        # were added or removed since the list was last built
+        self._agent_ticks: list[Callable[[], None]] | None = None
+
     # - - Assertions - -
     
     def _assert_pos_valid_and_open_for_agent(self, pos: GridPosition):
@@ -92,12 +110,12 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         
     def _assert_pos_valid_and_open_for_object(self, pos: GridPosition, obj_passable: bool):
         self._layout.assert_space_within_map_bounds(pos)
-        _pos = GridPosition(pos)
-        if _pos in self._object_positions:
+        _cell = self._cell(pos)
+        if self._obj_grid[_cell]:
             raise GridLayout.InvalidPositionError(
                 "'pos' already occupied by another object."
             )
-        if not obj_passable and self.position_occupied(_pos):
+        if not obj_passable and self._occupied[_cell]:
             raise GridLayout.InvalidPositionError(
                 "Cannot place an impassable object where an "
                 "agent is located."
@@ -107,16 +125,60 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
 
     def update_agent_position(self, agent: A, old_pos: GridPosition):
         if old_pos is not None:
-            self._agent_positions[old_pos].remove(agent)
-        self._agent_positions[agent.position].add(agent)
+            self._remove_from_agent_grid(agent, old_pos)
+        self._add_to_agent_grid(agent, agent.position)
         self.flag_agent_change()
 
     def update_obj_position(self, obj: O, old_pos: GridPosition):
         if old_pos is not None:
-            self._object_positions[old_pos].remove(obj)
-        self._object_positions[obj.pos].append(obj)
+            self._remove_from_obj_grid(obj, old_pos)
+        self._add_to_obj_grid(obj, obj.pos)
         self.flag_object_change()
 
+    # -- Position Grid Helpers --
+
+    def _cell(self, pos: GridPosition) -> int | None:
+        # flat index of `pos` into the per-cell state, or None if it lies 
+        # outside the map
+        _pos = pos if type(pos) is GridPosition else GridPosition(pos)
+        row, col = _pos._coords
+        if 0 <= row < self._height and 0 <= col < self._width:
+            return row * self._width + col
+        return None
+
+    def _add_to_agent_grid(self, agent: A, pos: GridPosition):
+        _cell = self._cell(pos)
+        _agents = self._agent_grid[_cell]
+        if _agents is None:
+            self._agent_grid[_cell] = {agent}
+        else:
+            _agents.add(agent)
+        self._occupied[_cell] = 1
+
+    def _remove_from_agent_grid(self, agent: A, pos: GridPosition):
+        _cell = self._cell(pos)
+        _agents = self._agent_grid[_cell]
+        _agents.remove(agent)
+        if not _agents:
+            self._occupied[_cell] = 0
+
+    def _add_to_obj_grid(self, obj: O, pos: GridPosition):
+        _cell = self._cell(pos)
+        _objs = self._obj_grid[_cell]
+        if _objs is None:
+            self._obj_grid[_cell] = [obj]
+        else:
+            _objs.append(obj)
+        if not obj.is_passable():
+            self._impassable[_cell] = 1
+
+    def _remove_from_obj_grid(self, obj: O, pos: GridPosition):
+        _cell = self._cell(pos)
+        _objs = self._obj_grid[_cell]
+        _objs.remove(obj)
+        if not obj.is_passable():
+            self._impassable[_cell] = not all(_obj.is_passable() for _obj in _objs)
+
 
     # -- Position Query Functions
 
@@ -124,23 +186,43 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         return self._layout.space_within_map_bounds(pos)
     
     def position_passable(self, pos: GridPosition) -> bool:
-        _objs = self.get_objects_at_position(pos)
-        for obj in _objs:
-            if not obj.is_passable():
-                return False  
-            
-        return True
+        _cell = self._cell(pos)
+        return _cell is None or not self._impassable[_cell]
     
     def position_occupied(self, pos: GridPosition) -> bool:
-        _agents = self.get_agents_at_position(pos)
-        return len(_agents) > 0
+        _cell = self._cell(pos)
+        return _cell is not None and self._occupied[_cell] == 1
     
     def space_valid_and_open(self, pos: GridPosition) -> bool:
-        cond1 = self.space_within_map_bounds(pos) and self.position_passable(pos)
-        if self._agents_can_share_spaces:
-            return cond1
-        else:
-            return cond1 and not self.position_occupied(pos)
+        _cell = self._cell(pos)
+        if _cell is None or self._impassable[_cell]:
+            return False
+        return self._agents_can_share_spaces or not self._occupied[_cell]
+        
+
+    def try_move(self, agent: A, new_pos: GridPosition, ignore_other_agents: bool = False) -> bool:
+        """
+        Checks whether an agent may move onto a position, in a single call.
+
+        Equivalent to checking :meth:`space_valid_and_open` and, unless 
+        `ignore_other_agents` is set, that no other agent is at `new_pos`. 
+
+        Arguments:
+            agent (GridWorldAgent): The agent that is moving.
+            new_pos (GridPosition): The position the agent is moving to.
+            ignore_other_agents (bool): Whether other agents at `new_pos` may be 
+                ignored. Only has an effect if agents can share spaces.
+
+        Returns:
+            bool: Whether the agent may move onto `new_pos`.
+        """
+        _cell = self._cell(new_pos)
+        if _cell is None or self._impassable[_cell]:
+            return False
+                
+        if self._occupied[_cell]:
+            return self._agents_can_share_spaces and ignore_other_agents
+        return True
         
 
     # - - Object Manipulation - -
@@ -149,59 +231,70 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         self._assert_object_valid(obj)
         self._assert_pos_valid_and_open_for_object(position, obj.is_passable())
 
-        _pos = GridPosition(position)
+        _pos = GridPosition.intern(position)
 
-        self._object_positions[_pos].append(obj)
-        self._objects.add(obj)
+        self._add_to_obj_grid(obj, _pos)
+        self._objects[obj] = None
         obj._set_pos(_pos)
 
         self.flag_object_change()
     
     def remove_object(self, obj: GridWorldObject):
-        self._object_positions[obj.pos].remove(obj)
-        self._objects.remove(obj)
+        self._remove_from_obj_grid(obj, obj.pos)
+        del self._objects[obj]
         obj._set_pos(None)
 
         self.flag_object_change()
     
     def clear_objects(self):
-        self._object_positions.clear()
+        self._obj_grid = [None] * len(self._obj_grid)
+        self._impassable = bytearray(len(self._impassable))
         self._objects.clear()
 
         self.flag_object_change()
     
     def get_objects_at_position(self, pos: GridPosition) -> list[GridWorldObject]:
-        _pos = GridPosition(pos)
-        
-        return list(self._object_positions[_pos])
+        _cell = self._cell(pos)
+        _objs = self._obj_grid[_cell] if _cell is not None else None
+        return list(_objs) if _objs else []
 
     # - - Agent Manipulation - -
     
     def add_agent(self, agent: A, pos: GridPosition, 
                   dir: GridWorldAgent.Direction = None): 
+        # checked before anything is registered, so a position outside the 
+        # map leaves the world unchanged
+        self._layout.assert_space_within_map_bounds(pos)
         super().add_agent(agent)
-        _pos = GridPosition(pos)
-        self._agent_positions[_pos].add(agent)
+        _pos = GridPosition.intern(pos)
+        self._add_to_agent_grid(agent, _pos)
         agent._set_position(_pos, dir)
+        self._agent_ticks = None
 
         self.flag_agent_change()
 
     def remove_agent(self, agent: GridWorldAgent):
+        # the agent forgets its position once it leaves the world
+        _pos = agent.position
         super().remove_agent(agent)
-        self._agent_positions[agent.position].remove(agent)
+        self._remove_from_agent_grid(agent, _pos)
+        self._agent_ticks = None
 
         self.flag_agent_change()
 
     def clear_agents(self):
         super().clear_agents()
             
-        self._agent_positions.clear()
+        self._agent_grid = [None] * len(self._agent_grid)
+        self._occupied = bytearray(len(self._occupied))
+        self._agent_ticks = None
 
         self.flag_agent_change()
 
     def get_agents_at_position(self, pos: GridPosition) -> list[GridWorldAgent]:
-        _pos = GridPosition(pos)
-        return list(self._agent_positions[_pos])
+        _cell = self._cell(pos)
+        _agents = self._agent_grid[_cell] if _cell is not None else None
+        return list(_agents) if _agents else []
     
     # - - Helpers for Resetting the World - -
 
@@ -237,39 +330,38 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         
     # - - World Trace - -
 
+    # the flags are set even while not recording, so the first step recorded 
+    # after recording is turned back on sees changes made in the meantime
+
     def flag_agent_change(self):
-        if self._recording:
-            self._agents_changed = True
+        self._agents_changed = True
 
     def flag_object_change(self):
-        if self._recording:
-            self._objs_changed = True
+        self._objs_changed = True
 
     def _record_state(self):
+        # Unchanged steps append the previous step's tuple again rather than 
+        # a copy, so a long stretch of identical steps costs one reference per
+        # step, and consumers can spot repeats with an identity check.
         
         # record new state of agents if they have changed
-        if self._agents_changed:
-            agent_trace = []
-            for pos, agents in self._agent_positions.items():
-                for agent in agents:
-                    agent_trace.append((type(agent), pos, agent.direction))
+        if self._agents_changed or not self._agent_trace:
+            agent_trace = tuple((type(agent), agent.position, agent.direction) 
+                                for agent in self._agents)
         else:
             agent_trace = self._agent_trace[-1]
 
         # record new state of objects if they have changed
-        if self._objs_changed:
-            obj_trace = []
-            for pos, objs in self._object_positions.items():
-                for obj in objs:
-                    obj_trace.append((type(obj), pos))
+        if self._objs_changed or not self._obj_trace:
+            obj_trace = tuple((type(obj), obj.pos) for obj in self._objects)
         else:
             obj_trace = self._obj_trace[-1]
 
-        self._agent_trace.append(tuple(agent_trace))
-        self._obj_trace.append(tuple(obj_trace))
+        self._agent_trace.append(agent_trace)
+        self._obj_trace.append(obj_trace)
 
-        self._agent_changed = False
-        self._obj_changed = False
+        self._agents_changed = False
+        self._objs_changed = False
 
 
     def get_traces(self):
@@ -284,9 +376,15 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
         self._recording = False
 
     def tick(self, num_steps=1):
+        # agent ticks run arbitrary programs, so the loop stays in Python; 
+        # bind each agent's tick once and reuse the list until the agents 
+        # change, instead of looking it up every step
         for _ in range(num_steps):
-            for agent in self._agents:
-                agent.tick()
+            agent_ticks = self._agent_ticks
+            if agent_ticks is None:
+                agent_ticks = self._agent_ticks = [agent.tick for agent in self._agents]
+            for agent_tick in agent_ticks:
+                agent_tick()
 
             if self._recording:
                 self._record_state()
@@ -313,7 +411,7 @@ class GridWorld[A: GridWorldAgent = GridWorldAgent,
     
     @property
     def num_agents(self) -> int:
-        return len(self._agent_positions)
+        return len(self._agents)
     
     @property
     def height(self) -> int:
@@ -28,29 +28,37 @@ class GridWorldAgent(Agent):
             if not isinstance(value, Integral):
                 raise TypeError(f"Unsupported operand type(s) for +=: 'Direction' and '{type(value).__name__}'")
             
-            return GridWorldAgent.Direction((self.value + value) % 4) 
+            return GridWorldAgent.Direction._TURNS[self.value][value & 3]
         
         # Override subtraction to wrap around
         def __sub__(self, value):
             if not isinstance(value, Integral):
                 raise TypeError(f"Unsupported operand type(s) for +=: 'Direction' and '{type(value).__name__}'")
             
-            return GridWorldAgent.Direction((self.value - value) % 4) 
-        
-        def __eq__(self, value):
-            return self.value == value
+            return GridWorldAgent.Direction._TURNS[self.value][-value & 3]
         
         def __index__(self):
             return self.value
-
-    _DIRECTIONS = [(0,1),          # Right
+        
+    # _TURNS[d][k] is the direction k quarter turns clockwise from d, so 
+    # turning looks up an existing member instead of calling Direction(...)
+    _order = tuple(Direction)
+    Direction._TURNS = (_order, _order[1:] + _order[:1], 
+                        _order[2:] + _order[:2], _order[3:] + _order[:3])
+    del _order
+
+    _DIRECTIONS = ((0,1),          # Right
                    (1,0),          # Down
                    (0,-1),         # Left
-                   (-1,0)]         # Up
+                   (-1,0))         # Up
+    
+    # the same offsets as a read-only array, one row per direction
+    _DIRECTION_VECS = np.array(_DIRECTIONS, dtype=np.int64)
+    _DIRECTION_VECS.flags.writeable = False
     
     @classmethod
     def direction_to_vec(cls, dir: Direction):
-        return np.array(cls._DIRECTIONS[dir])
+        return cls._DIRECTION_VECS[dir]
     
     @classmethod
     def valid_world_classes(cls):
@@ -65,6 +73,8 @@ class GridWorldAgent(Agent):
     # - - Instance Definition - - #
     ###############################
 
+    __slots__ = ('_pos', '_dir', '_try_move', '_update_position', '_objects_at')
+
     def __init__(self, program: AgentProgramTree = None, autogen=True):
         super(GridWorldAgent, self).__init__(program, autogen)
 
@@ -72,17 +82,28 @@ class GridWorldAgent(Agent):
         self._pos: GridPosition = None
         self._dir: GridWorldAgent.Direction = GridWorldAgent.Direction.RIGHT
 
+        # bound methods of the current world, used on every move
+        self._try_move = None
+        self._update_position = None
+        self._objects_at = None
+
     def _set_world(self, world: 'GridWorld'):
         from .grid_world import GridWorld
 
         if not isinstance(world, GridWorld):
             raise TypeError(f"Agent must be bound to an instance of GridWorld to function properly. Instead found object of type {type(world)}")
             
-        return super()._set_world(world)
+        super()._set_world(world)
+        self._try_move = world.try_move
+        self._update_position = world.update_agent_position
+        self._objects_at = world.get_objects_at_position
     
     def _clear_world(self):
         super()._clear_world()
         self._pos = None
+        self._try_move = None
+        self._update_position = None
+        self._objects_at = None
 
     def _set_position(self, pos: GridPosition, dir: Direction = None):
         """
@@ -97,7 +118,7 @@ class GridWorldAgent(Agent):
         if self._requires_world and self._world is None:
             raise Agent.WorldNotSetError("Cannot set position of agent in world when world is not set")
         
-        self._pos = GridPosition(pos)
+        self._pos = GridPosition.intern(pos)
         if dir is not None:
             self._dir = dir
 
@@ -107,7 +128,7 @@ class GridWorldAgent(Agent):
     # -- Listeners --
 
     def _on_changed_pos(self, old_pos):
-        self._world.update_agent_position(agent=self, old_pos=old_pos)
+        self._update_position(agent=self, old_pos=old_pos)
         
     def _on_action_taken(self):
         super()._on_action_taken()
@@ -119,7 +140,7 @@ class GridWorldAgent(Agent):
     # - - Helpers - -
 
     def _trigger_obj_on_curr_space(self):
-        objs_at_pos: list[GridWorldObject] = self._world.get_objects_at_position(self._pos)       # get the object on top
+        objs_at_pos: list[GridWorldObject] = self._objects_at(self._pos)       # get the object on top
         if len(objs_at_pos) > 0:
             objs_at_pos[-1].trigger(agent=self)
 
@@ -148,12 +169,15 @@ class GridWorldAgent(Agent):
 
     def move_forward(self, ignore_other_agents=False):
         _old_pos = self._pos
-        new_pos = self._pos + GridWorldAgent._DIRECTIONS[self._dir]
+        # the step is plain int arithmetic on the coordinate tuple; the sum of 
+        # two valid int coordinates is valid, so __init__'s checks are skipped
+        row, col = _old_pos._coords
+        d_row, d_col = GridWorldAgent._DIRECTIONS[self._dir.value]
+        new_pos = GridPosition._intern_unchecked((row + d_row, col + d_col))
         
-        if self._world.space_valid_and_open(new_pos):
-            if ignore_other_agents or not self._world.position_occupied(new_pos):
-                self._pos = new_pos
-                self._on_changed_pos(_old_pos)
+        if self._try_move(self, new_pos, ignore_other_agents):
+            self._pos = new_pos
+            self._on_changed_pos(_old_pos)
 
         self._on_action_taken()
             
@@ -5,7 +5,9 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.patches import FancyArrow
 from matplotlib.colors import LinearSegmentedColormap, to_rgb
-from scipy.sparse import coo_matrix, lil_matrix
+from scipy.sparse import coo_matrix
+
+import numpy as np
 
 from itertools import chain
 from typing import Union, Type, Tuple, TYPE_CHECKING
@@ -22,6 +24,20 @@ type Color = Union[str, Tuple[float, float, float], Tuple[int, int, int]]
 type Arrow = Tuple[float, float, float, float, Color, float]         # Tuple[x, y, dx, dy, color, width]
 type Frame = Tuple[coo_matrix, list[Arrow]]
 
+# -- Arrow Geometry --
+
+_ARROW_LEN = 0.5            # how long the arrow is
+_ARROW_START_OFFSET = 0.25  # move arrow slightly forward from center
+_ARROW_WIDTH = 0.2
+
+# (x offset, y offset, dx, dy) of an agent's arrow for each direction, indexed 
+# by Direction.value. Direction vectors are (dy, dx), hence the column swap.
+_dir_vecs = GridWorldAgent._DIRECTION_VECS[:, ::-1]
+_ARROW_GEOMETRY: tuple[tuple[float, float, float, float], ...] = tuple(
+    map(tuple, np.hstack((_dir_vecs * _ARROW_START_OFFSET, 
+                          _dir_vecs * _ARROW_LEN)).tolist()))
+del _dir_vecs
+
 # -- Animation Class -- 
 
 class GridWorldAnimation(WorldAnimation):
@@ -67,20 +83,32 @@ class GridWorldAnimation(WorldAnimation):
                         class_to_color_index,
                         arrow_colors_dict: dict[Type[GridWorldAgent], Color]) -> list[Frame]:
         frames = []
-        for frame in zip(obj_trace, agent_trace):
-            grid = lil_matrix(world_dims)
-            objs_in_frame, agents_in_frame = frame
-
+        prev_objs = prev_agents = None
+        for objs_in_frame, agents_in_frame in zip(obj_trace, agent_trace):
+            # GridWorld repeats the previous step's tuples when nothing 
+            # changed, so the previous frame can be reused as is
+            if objs_in_frame is prev_objs and agents_in_frame is prev_agents:
+                frames.append(frames[-1])
+                continue
+            prev_objs, prev_agents = objs_in_frame, agents_in_frame
+
+            # color index per (row, col); agents come last so they are drawn 
+            # over any object in the same cell
+            cells: dict[tuple[int, int], float] = {}
             for obj_cls, pos in objs_in_frame:
-                grid[*pos.coords] = class_to_color_index[obj_cls]
+                cells[pos._coords] = class_to_color_index[obj_cls]
 
             arrows: list[Arrow] = []
             for agent_cls, pos, _dir in agents_in_frame:
-                grid[*pos.coords] = class_to_color_index[agent_cls]
+                cells[pos._coords] = class_to_color_index[agent_cls]
                 if arrow_colors_dict is not None:
                     arrows.append(self._create_arrow(pos, _dir, agent_cls, arrow_colors_dict))
 
-            frames.append((grid.tocoo(), arrows))
+            rows = [row for row, _ in cells]
+            cols = [col for _, col in cells]
+            grid = coo_matrix((list(cells.values()), (rows, cols)), shape=world_dims)
+
+            frames.append((grid, arrows))
         
         return frames
     
@@ -89,30 +117,15 @@ class GridWorldAnimation(WorldAnimation):
         Returns an Arrow tuple (x, y, dx, dy, color, width) for matplotlib.
         Starts at the front-middle of the agent's cell in the grid.
         """
-        arrow_len = 0.5   # how long the arrow is
-        start_offset = 0.25  # move arrow slightly forward from center
-
         # agent_pos = (row, col)
-        row, col = agent_pos
-
-        # center of the cell
-        x = col
-        y = row
-
-        # direction vector (dy, dx) in cell coordinates
-        dir_vec = GridWorldAgent.direction_to_vec(agent_dir)  # assume returns (dy, dx)
-        dy, dx = dir_vec
+        row, col = agent_pos._coords
 
-        # move starting point forward slightly in the direction the agent is facing
-        x += dx * start_offset
-        y += dy * start_offset
-
-        # scale the direction to the arrow length
-        dx *= arrow_len
-        dy *= arrow_len
+        # offsets from the center of the cell, precomputed per direction
+        x_offset, y_offset, dx, dy = _ARROW_GEOMETRY[agent_dir.value]
 
         # return as (x, y, dx, dy, color, width)
-        return (x, y, dx, dy, arrow_colors_dict[agent_class], 0.2)
+        return (col + x_offset, row + y_offset, dx, dy, 
+                arrow_colors_dict[agent_class], _ARROW_WIDTH)
     
 
     # - - Public Methods - -
@@ -131,13 +144,26 @@ class GridWorldAnimation(WorldAnimation):
         first_grid, first_arrows = self._frames[0]
         img = self.ax.imshow(first_grid.toarray(), cmap=self._CMAP, vmin=0, vmax=1)
 
-        # Create arrow artists
+        # Create one arrow artist per agent up front and move them around in 
+        # update, rather than replacing every arrow on every frame
+        num_arrows = max(len(arrows) for _, arrows in self._frames)
         arrow_artists = []
-        for x, y, dx, dy, color, width in first_arrows:
-            arrow = FancyArrow(x, y, dx, dy, color=color, width=width)
+        for _ in range(num_arrows):
+            arrow = FancyArrow(0, 0, 0, 0, visible=False)
             self.ax.add_patch(arrow)
             arrow_artists.append(arrow)
 
+        def set_arrows(arrows: list[Arrow]):
+            for arrow, (x, y, dx, dy, color, width) in zip(arrow_artists, arrows):
+                arrow.set_data(x=x, y=y, dx=dx, dy=dy, width=width)
+                arrow.set_color(color)
+                arrow.set_visible(True)
+            # hide the artists this frame has no arrows for
+            for arrow in arrow_artists[len(arrows):]:
+                arrow.set_visible(False)
+
+        set_arrows(first_arrows)
+
         # Keep a title artist for blitting
         title_artist = self.ax.set_title("Frame 0")
 
@@ -148,16 +174,7 @@ class GridWorldAnimation(WorldAnimation):
             img.set_data(grid.toarray())
 
             # Update arrows
-            # Remove old arrows
-            for arrow in arrow_artists:
-                arrow.remove()
-            arrow_artists.clear()
-
-            # Add new arrows
-            for x, y, dx, dy, color, width in arrows:
-                arrow = FancyArrow(x, y, dx, dy, color=color, width=width)
-                self.ax.add_patch(arrow)
-                arrow_artists.append(arrow)
+            set_arrows(arrows)
 
             # Update title
             title_artist.set_text(f"Frame {frame_idx}")
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 class GridWorldObject(WorldObject):
 
+    __slots__ = ('_is_passable', '_ignore_passability', '_pos')
+
     @classmethod
     @abstractmethod
     def is_passable(self) -> bool:
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 class GridWorldReward(RewardObjectMixin, GridWorldObject):
 
+    __slots__ = ('_remaining_amount', '_base_yield')
+
     @classmethod
     def is_passable(self):
         return True
@@ -109,7 +109,7 @@ with Grammar() as grammar:
 
 # - - TESTS - - 
 
-PATH_TO_RANDINT_MODULE = 'grammaticalevolutiontools.programs.nodes.factor_nodes.rand_int_node.random.randint'
+PATH_TO_RANDRANGE = 'grammaticalevolutiontools.programs.nodes.factor_nodes.rand_int_node.random.randrange'
     
 def test_class_level_properties_correct():
     assert MyRootNode._ORIGINAL_NODE_CLS is not None
@@ -223,17 +223,17 @@ def test_custom_node_assertions_and_helpers_not_copied():
         
 
 def test_dynamic_custom_properties_work_correctly(mocker):
-    mock_randint = mocker.patch(
-        PATH_TO_RANDINT_MODULE,
+    mock_randrange = mocker.patch(
+        PATH_TO_RANDRANGE,
         side_effect=[1, 2]  # First call returns 1, second returns 2
     )
     instance1: RandIntegerNode = MyRandInt()
     instance2: RandIntegerNode = MyRandInt()
 
-    assert mock_randint.call_count == 2
-    mock_randint.assert_has_calls([
-        mocker.call(1, 3),
-        mocker.call(1, 3)
+    assert mock_randrange.call_count == 2
+    mock_randrange.assert_has_calls([
+        mocker.call(1, 4),
+        mocker.call(1, 4)
     ])
     
     assert instance1._val == 1
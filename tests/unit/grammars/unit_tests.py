@@ -254,12 +254,12 @@ class TestNodeConverter(unittest.TestCase):
     # instance of the new class rather than being copied from a 
     # single instance of the ProgramNode class to every 
     # instance of the new class
-    @patch('random.randint')
-    def test_dynamic_custom_properties_work_correctly(self, mock_randint):
-        mock_randint.return_value = 1
+    @patch('random.randrange')
+    def test_dynamic_custom_properties_work_correctly(self, mock_randrange):
+        mock_randrange.return_value = 1
         instance1: RandIntegerNode = MyRandInt()
 
-        mock_randint.return_value = 2
+        mock_randrange.return_value = 2
         instance2: RandIntegerNode = MyRandInt()
         
         self.assertEqual(instance1._val, 1)
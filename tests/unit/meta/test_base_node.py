@@ -309,6 +309,20 @@ class TestStaticUtils:
         assert arr.shape == (2,)
         assert arr.dtype == np.float64
 
+    @staticmethod
+    def test_probs_to_alias_table():
+        weights = [1, 0, 3, 4]
+        prob, alias = BaseNode.probs_to_alias_table(weights)
+        n = len(weights)
+
+        # probability mass that each entry ends up with after aliasing
+        mass = np.array(prob) / n
+        for j in range(n):
+            mass[alias[j]] += (1 - prob[j]) / n
+
+        assert np.allclose(mass, np.array(weights) / sum(weights))
+        assert BaseNode.probs_to_alias_table([]) == ([], [])
+
     @staticmethod
     def test_convert_probs_dict_to_numpy():
         probs_dict = {
@@ -663,6 +677,21 @@ class TestBaseNodeChildManagement:
         assert 1 not in inter2._list
         assert 1 not in child2._list
 
+    @staticmethod
+    def test_collect_descendants_deep_chain_does_not_recurse():
+        import sys
+
+        root = MockNode1Child()
+        curr = root
+        for _ in range(sys.getrecursionlimit() + 100):
+            child = MockNode1Child()
+            curr._children[0] = child
+            curr = child
+
+        nodes = root.collect_descendants(traversal_mode='attach')
+        assert len(nodes) == sys.getrecursionlimit() + 101
+        assert curr._depth == sys.getrecursionlimit() + 100
+
     # - - Test add_child - -
 
     @staticmethod
@@ -795,7 +824,47 @@ class TestBaseNodeChildManagement:
             assert inter1._depth != inter3._depth + 1
             assert inter1._depth == root._depth + 1
             assert inter1._parent is root
-        
+
+    # - - Test set_children - -
+
+    @staticmethod
+    def test_set_children_success():
+        root = MockNode2Children()
+        inter = MockNode1Child()
+        leaf = MockNodeNoChildren()
+        child = MockNodeNoChildren()
+
+        inter.add_child(leaf, index=0)
+        root.set_children([child, inter])
+
+        assert root._children == [child, inter]
+        assert root.num_children == 2
+        assert child._parent is root and inter._parent is root
+        assert leaf._depth == root._depth + 2
+
+    @staticmethod
+    def test_set_children_failure_leaves_node_unchanged():
+        root = MockNode2Children()
+        child1 = MockNode1Child()
+        child2 = MockNodeNoChildren()
+
+        with pytest.raises(TypeError, match="new_child does not match possible child types"):
+            root.set_children([child2, MockNode2Children()])
+        with pytest.raises(ValueError, match="Cannot occupy two slots at once"):
+            root.set_children([child2, child2])
+
+        assert root.num_children == 0
+        assert child2._parent is None
+
+        # cycle: root is already an ancestor of child1
+        child1._children[0] = root
+        root._parent = child1
+        with pytest.raises(ValueError, match="New child caused a cycle."):
+            root.set_children([None, child1])
+
+        assert root._children == [None, None]
+        assert root.num_children == 0
+
 
     # - - Other child functions- -
 
@@ -151,6 +151,13 @@ class TestBaseNodeMeta:
         with pytest.raises(TypeError):
             TestBaseNodeMeta.NewClassDefaultParamsInInit()
 
+    @staticmethod
+    def test_init_args_checked_at_class_creation():
+        assert '__init__' in \
+            TestBaseNodeMeta.NewClassParamsInInit.__abstractmethods__
+        assert '__init__' not in \
+            TestBaseNodeMeta.NewClassNoParams.__abstractmethods__
+
     @staticmethod
     def test_non_abstract_class_can_be_instantiated():
         TestBaseNodeMeta.get_test_node()
@@ -0,0 +1,73 @@
+from grammaticalevolutiontools.programs.nodes import (
+    ConditionNode, ExecutableNode, IntegerNode)
+
+import pytest
+
+
+class Act(ExecutableNode):
+    def _base_node_init(self):
+        super()._base_node_init('ACT')
+    def execute(self):
+        pass
+
+
+class One(IntegerNode):
+    def _base_node_init(self):
+        super()._base_node_init()
+    def _custom_init(self):
+        super()._custom_init(1)
+
+
+class Two(IntegerNode):
+    def _base_node_init(self):
+        super()._base_node_init()
+    def _custom_init(self):
+        super()._custom_init(2)
+
+
+class AbstractLessThan(ConditionNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<LT>', label='lt',
+                                possible_children_true=[Act],
+                                possible_children_false=[Act],
+                                factor_possible_vals=[[One], [Two]])
+    def condition(self):
+        return self._get_factor('a').value < self._get_factor('b').value
+
+
+class LessThan(AbstractLessThan):
+    def _custom_init(self):
+        super()._custom_init(factor_names=['a', 'b'])
+
+
+class DuplicateNames(AbstractLessThan):
+    def _custom_init(self):
+        super()._custom_init(factor_names=['a', 'a'])
+
+
+def test_factor_access_by_name_and_position():
+    node = LessThan()
+    one, two = One(), Two()
+    node.add_child(one, 2)
+    node.add_child(two, 3)
+
+    assert node._get_factor('a') is one
+    assert node._get_factor('b') is two
+    assert node._get_factor_at(0) is one
+    assert node._get_factor_at(1) is two
+
+
+def test_duplicate_factor_names_rejected():
+    with pytest.raises(ValueError, match="Same factor name used twice"):
+        DuplicateNames()
+
+
+def test_get_next_child_follows_condition():
+    node = LessThan()
+    t_child, f_child = Act(), Act()
+    node.set_children([t_child, f_child, One(), Two()])
+
+    assert node.get_next_child() is t_child
+    assert node.is_running()
+    assert node.get_next_child() is None
+    assert not node.is_running()
@@ -105,6 +105,22 @@ def test_init_fail__invalid_token():
     with pytest.raises(TypeError):
         NodeTestingVals()
 
+def test_fast_construct_skips_validation():
+    global _token, _num_children, _is_terminal, _is_root, _label
+    _num_children = 0
+    _is_terminal = True
+    _is_root = False
+    _label = None
+    _token = ''
+
+    with ProgramNode.fast_construct():
+        node = NodeTestingVals()
+    assert node._token == ''
+    assert ProgramNode.FAST_CONSTRUCT is False
+
+    with pytest.raises(ValueError):
+        NodeTestingVals()
+
 def test_init_fail__invalid_num_children():
     global _token, _num_children, _is_terminal, _is_root, _label
     _token = "<invalid>"
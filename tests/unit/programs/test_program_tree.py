@@ -4,9 +4,252 @@ import pytest
 
 from unittest.mock import MagicMock, create_autospec
 
+from grammaticalevolutiontools.programs.nodes import (
+    RootNode, SequentialNode, ExecutableNode, RepeatNode, IntegerNode)
+
 
 class TestProgramTreeAsertions:
 
     @staticmethod
     def test_init():
         pass
+
+
+log = []
+
+
+class Act(ExecutableNode):
+    def _base_node_init(self):
+        super()._base_node_init('ACT')
+    def execute(self):
+        log.append(self)
+
+
+class Seq(SequentialNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<S>', num_children=3,
+                                possible_children=[Act])
+
+
+class OuterSeq(SequentialNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<OS>', num_children=2,
+                                possible_children=[Seq])
+
+
+class Root(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[Seq])
+
+
+class NestedRoot(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[OuterSeq])
+
+
+class EitherRoot(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[Seq, OuterSeq])
+
+
+class RevSeq(Seq):
+    # visits its children last to first
+    def get_next_child(self):
+        if self._curr_child < 0:
+            next_child = self._num_children - 1
+        else:
+            next_child = self._curr_child - 1
+        self._curr_child = next_child
+        return self._children[next_child] if next_child >= 0 else None
+
+
+class RevRoot(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[RevSeq])
+
+
+class CountingSeq(SequentialNode):
+    # runs its only child twice, using `_curr_child` as a count of the 
+    # times it was handed out rather than as an index
+    def _base_node_init(self):
+        super()._base_node_init(token='<CS>', num_children=1,
+                                possible_children=[Seq])
+    def get_next_child(self):
+        count = max(self._curr_child, 0) + 1
+        if count > 2:
+            self._curr_child = -1
+            return None
+        self._curr_child = count
+        return self._children[0]
+
+
+class CountingRoot(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[CountingSeq])
+
+
+class Three(IntegerNode):
+    def _base_node_init(self):
+        super()._base_node_init()
+    def _custom_init(self):
+        super()._custom_init(3)
+
+
+class Rep(RepeatNode):
+    def _base_node_init(self):
+        super()._base_node_init(possible_numbers=[Three],
+                                possible_child_types=[Act])
+
+
+class RepRoot(RootNode):
+    def _base_node_init(self):
+        super()._base_node_init(token='<R>', possible_children=[Rep])
+
+
+class TestProgramTreeStructure:
+
+    @staticmethod
+    def test_incomplete_nodes_tracked_through_edits():
+        tree = ProgramTree(NestedRoot, autofill=False)
+        assert tree._incomplete == {tree.root}
+
+    @staticmethod
+    def test_fill_uses_child_dists_changed_after_init():
+        ProgramTree(Root)
+        ProgramTree(EitherRoot)
+        assert Root.__dict__['_ALIAS_TABLES']
+
+        root = Root()
+        root._set_possible_children(0, [OuterSeq])
+        tree = ProgramTree(root)
+        assert type(tree.root.children[0]) is OuterSeq
+
+        for _ in range(10):
+            root = EitherRoot()
+            root._set_child_probs(0, [0, 1])
+            tree = ProgramTree(root)
+            assert type(tree.root.children[0]) is OuterSeq
+
+        # other instances keep the distribution of their class
+        assert type(ProgramTree(Root).root.children[0]) is Seq
+
+        tree._fill_out_program()
+        assert not tree._incomplete
+
+        outer = tree.root.children[0]
+        outer.pop_child(1)
+        assert tree._incomplete == {outer}
+
+        tree._fill_out_program()
+        assert not tree._incomplete
+        assert outer.num_children == 2
+
+        # detached branches leave the set along with their nodes
+        inner = outer.children[0]
+        inner.pop_child(0)
+        tree.root.pop_child(0)
+        assert tree._incomplete == {tree.root}
+
+    @staticmethod
+    def test_nodes_snapshot_reused_until_structure_changes():
+        tree = ProgramTree(Root)
+        nodes = tree.nodes
+        assert isinstance(nodes, frozenset)
+        assert tree.nodes is nodes
+        assert nodes == tree._nodes
+
+        seq = tree.root.children[0]
+        old_child = seq.children[0]
+        tree.replace_node(old_child)
+        assert tree.nodes is not nodes
+        assert old_child not in tree.nodes
+        assert tree.nodes == tree._nodes
+
+
+class TestProgramTreeExecution:
+
+    @staticmethod
+    def test_run_static_program_from_schedule():
+        log.clear()
+        tree = ProgramTree(Root)
+        acts = tree.root.children[0].children
+
+        tree.run(n=2)
+        assert log == acts * 2
+        assert tree._schedule == acts
+        assert not tree.running()
+
+        # structural edits invalidate the schedule
+        tree.replace_node(acts[1])
+        assert tree._schedule is None
+        log.clear()
+        tree.run()
+        assert log == tree.root.children[0].children
+
+    @staticmethod
+    def test_run_uses_overridden_child_order():
+        assert not RevSeq.STATIC_ORDER
+        assert Seq.STATIC_ORDER
+
+        log.clear()
+        tree = ProgramTree(RevRoot)
+        acts = tree.root.children[0].children
+
+        tree.run()
+        assert log == acts[::-1]
+        assert not tree.running()
+
+    @staticmethod
+    def test_kill_resets_running_branch():
+        tree = ProgramTree(NestedRoot)
+        for _ in range(4):
+            tree.tick()
+
+        running = [node for node in tree.nodes
+                   if getattr(node, '_curr_child', -1) > -1]
+        assert len(running) == 3      # root, outer and inner sequence
+        assert tree.root.running_children == [tree.root.children[0]]
+
+        tree.kill()
+        assert not tree.running()
+        assert all(getattr(node, '_curr_child', -1) == -1 for node in tree.nodes)
+
+    @staticmethod
+    def test_kill_resets_branch_without_index_in_curr_child():
+        tree = ProgramTree(CountingRoot)
+        counting = tree.root.children[0]
+        inner = counting.children[0]
+        for _ in range(6):
+            tree.tick()
+
+        assert counting._curr_child == 2      # second run of its child
+        assert inner.is_running()
+        assert counting.running_children == [inner]
+
+        tree.kill()
+        assert not tree.running()
+        assert all(getattr(node, '_curr_child', -1) == -1 for node in tree.nodes)
+
+    @staticmethod
+    def test_repeat_node_runs_child_num_repeats_times():
+        log.clear()
+        tree = ProgramTree(RepRoot)
+        rep = tree.root.children[0]
+        assert rep.num_repeats == 3
+
+        tree.run()
+        assert log == [rep.children[1]] * 3
+
+    @staticmethod
+    def test_kill_resets_repeat_count():
+        log.clear()
+        tree = ProgramTree(RepRoot)
+        rep = tree.root.children[0]
+        tree.tick()
+        assert log == [rep.children[1]]
+
+        tree.kill()
+        log.clear()
+        while tree.tick():
+            pass
+        assert log == [rep.children[1]] * 3
@@ -1,5 +1,6 @@
 from grammaticalevolutiontools.worlds.base import WorldLayout
 from grammaticalevolutiontools.worlds.base import WorldObject
+from grammaticalevolutiontools.worlds.base.objects import RewardObjectMixin
 from grammaticalevolutiontools.worlds import World
 from grammaticalevolutiontools.agents import Agent
 
@@ -18,7 +19,7 @@ class BasicWorldAgent(Agent):
     _default_grammar = None
 
     def __init__(self):
-        super().__init__()
+        super().__init__(autogen=False)
 
 
 # - - Layouts - - 
@@ -51,8 +52,7 @@ class BasicWorld(World):
     _layout_class = EmptyLayout
 
     def __init__(self):
-        super(BasicWorld, self).__init__(agent_class=[BasicWorldAgent], obj_types=[], 
-                                         world_layout=EmptyLayout(lock=True))
+        super(BasicWorld, self).__init__(layout=EmptyLayout(lock=True))
         
     def tick(self):
         for agent in self._agents:
@@ -65,6 +65,26 @@ class BasicWorld(World):
         pass
 
 
+# - - Objects - - 
+
+class BasicObject(WorldObject):
+    def trigger(self, agent):
+        pass
+
+
+class RewardObject(RewardObjectMixin, WorldObject):
+    def __init__(self, world, total_amount=10, base_yield=1):
+        WorldObject.__init__(self, world)
+        RewardObjectMixin.__init__(self, total_amount, base_yield)
+
+    def trigger(self, agent):
+        self._give_reward(agent)
+
+
+class RewardNotObject(RewardObjectMixin):
+    pass
+
+
 # - - Nodes - - 
 
 class CodeNode(RootNode):
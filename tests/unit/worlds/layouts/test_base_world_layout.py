@@ -1,7 +1,9 @@
-from grammaticalevolutiontools.worlds.layouts import WorldLayout
-from ...utilities_.BasicWorld import EmptyLayout
+from grammaticalevolutiontools.worlds import WorldLayout
+from ...utilities_.BasicWorld import EmptyLayout, BasicObject
 
+import gc
 import pytest
+import weakref
 
 
 class TestBaseAgent:
@@ -44,3 +46,14 @@ class TestBaseAgent:
         with pytest.raises(WorldLayout.LayoutLockedError):
             layout._assert_not_locked()
 
+    def test_validated_obj_classes_can_be_collected(self):
+        class TempObject(BasicObject):
+            pass
+
+        EmptyLayout()._assert_valid_obj_class(TempObject)
+        assert TempObject in WorldLayout._valid_obj_classes
+
+        ref = weakref.ref(TempObject)
+        del TempObject
+        gc.collect()
+        assert ref() is None
@@ -0,0 +1,32 @@
+from grammaticalevolutiontools.worlds.grid_world import GridLayout, GridWorldObject
+
+
+class Rock(GridWorldObject):
+    @classmethod
+    def is_passable(cls):
+        return False
+    def trigger(self, agent):
+        pass
+
+
+class TestGridLayoutPositionsNear:
+
+    @staticmethod
+    def test_positions_within_manhattan_distance():
+        layout = GridLayout().load_map_layout_from_dict(
+            5, 5, pos_obj_dict={(0, 0): Rock, (1, 1): Rock, (4, 4): Rock})
+
+        assert set(layout.positions_near((0, 0), 2)) == {(0, 0), (1, 1)}
+        assert layout.positions_near((0, 0), 1) == [(0, 0)]
+        assert layout.positions_near((2, 2), 1) == []
+        assert len(layout.positions_near((2, 2), 4)) == 3
+
+    @staticmethod
+    def test_added_objects_are_found():
+        layout = GridLayout().load_map_layout_from_dict(
+            5, 5, pos_obj_dict={(0, 0): Rock}, lock=False)
+        assert layout.positions_near((2, 2), 1) == []
+
+        layout.add_object(Rock, (2, 3))
+        assert layout.positions_near((2, 2), 1) == [(2, 3)]
+        assert set(layout.positions_near((1, 1), 3)) == {(0, 0), (2, 3)}
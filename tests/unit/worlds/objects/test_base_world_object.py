@@ -1,4 +1,4 @@
-from grammaticalevolutiontools.worlds.objects import WorldObject
+from grammaticalevolutiontools.worlds import WorldObject
 from ...utilities_ import BasicWorld as bw
 
 import pytest
@@ -0,0 +1,265 @@
+from grammaticalevolutiontools.worlds.grid_world import (
+    GridWorld, GridLayout, GridWorldAgent, GridWorldObject, GridWorldReward)
+
+import pytest
+
+
+Direction = GridWorldAgent.Direction
+
+
+class Wall(GridWorldObject):
+    @classmethod
+    def is_passable(cls):
+        return False
+    def trigger(self, agent):
+        pass
+
+
+class Rug(GridWorldObject):
+    @classmethod
+    def is_passable(cls):
+        return True
+    def trigger(self, agent):
+        pass
+
+
+class Food(GridWorldReward):
+    def __init__(self, world):
+        super().__init__(3, 1, world)
+
+
+class Counter(GridWorldAgent):
+    # counts its ticks instead of running a program
+    def __init__(self, on_tick=None):
+        super().__init__(autogen=False)
+        self.ticks = 0
+        self.on_tick = on_tick
+    def tick(self):
+        self.ticks += 1
+        if self.on_tick is not None:
+            self.on_tick(self)
+
+
+def make_world(pos_obj_dict=None, **kwargs):
+    # 4 columns by 3 rows, positions are (row, col)
+    layout = GridLayout().load_map_layout_from_dict(
+        4, 3, pos_obj_dict=pos_obj_dict if pos_obj_dict is not None else {})
+    world = GridWorld(layout, **kwargs)
+    world.load_new_agents({})          # places the layout's objects
+    return world
+
+
+def make_agent():
+    return GridWorldAgent(autogen=False)
+
+
+class TestGridWorldPositions:
+
+    @staticmethod
+    def test_agents_added_moved_and_removed():
+        world = make_world()
+        agent = make_agent()
+        world.add_agent(agent, (0, 0), Direction.RIGHT)
+
+        assert world.position_occupied((0, 0))
+        assert world.get_agents_at_position((0, 0)) == [agent]
+        assert world.num_agents == 1
+
+        agent.move_forward()
+        assert agent.position == (0, 1)
+        assert not world.position_occupied((0, 0))
+        assert world.get_agents_at_position((0, 1)) == [agent]
+
+        world.remove_agent(agent)
+        assert not world.position_occupied((0, 1))
+        assert world.get_agents_at_position((0, 1)) == []
+        assert world.num_agents == 0
+
+    @staticmethod
+    def test_agent_not_added_at_invalid_position():
+        world = make_world({(1, 1): Wall})
+        world.add_agent(make_agent(), (0, 0))
+
+        for pos in [(5, 5), (-1, 0), (0, 4), (3, 0)]:
+            agent = make_agent()
+            with pytest.raises(GridLayout.InvalidPositionError):
+                world.add_agent(agent, pos)
+            assert agent not in world.get_all_agents()
+            assert not agent.assigned_to_world()
+        assert world.num_agents == 1
+
+    @staticmethod
+    def test_load_new_agents_places_agents_sharing_a_start_cell():
+        # start positions are only checked against the map bounds
+        world = make_world(agents_can_share_spaces=False)
+        first, second = make_agent(), make_agent()
+        world.load_new_agents({first: ((0, 0), Direction.RIGHT),
+                               second: ((0, 0), Direction.DOWN)})
+
+        assert world.num_agents == 2
+        assert set(world.get_agents_at_position((0, 0))) == {first, second}
+
+    @staticmethod
+    def test_objects_added_and_removed():
+        world = make_world({(1, 1): Wall})
+        wall = world.get_objects_at_position((1, 1))[0]
+        assert isinstance(wall, Wall)
+        assert not world.position_passable((1, 1))
+
+        world.remove_object(wall)
+        assert world.position_passable((1, 1))
+        assert world.get_objects_at_position((1, 1)) == []
+
+        # the emptied cell can take a new object
+        rug = Rug(world)
+        world.add_object(rug, (1, 1))
+        assert world.position_passable((1, 1))
+        assert world.get_objects_at_position((1, 1)) == [rug]
+
+        with pytest.raises(GridLayout.InvalidPositionError):
+            world.add_object(Rug(world), (1, 1))
+
+        world.clear_objects()
+        assert world.get_all_objects() == set()
+        assert world.get_objects_at_position((1, 1)) == []
+
+    @staticmethod
+    def test_impassable_object_not_placed_on_agent():
+        world = make_world()
+        world.add_agent(make_agent(), (2, 3))
+
+        with pytest.raises(GridLayout.InvalidPositionError):
+            world.add_object(Wall(world), (2, 3))
+        world.add_object(Rug(world), (2, 3))
+
+    @staticmethod
+    def test_space_valid_and_open():
+        world = make_world({(1, 1): Wall, (1, 2): Rug})
+        world.add_agent(make_agent(), (0, 0))
+
+        assert world.space_valid_and_open((0, 1))
+        assert world.space_valid_and_open((1, 2))
+        assert not world.space_valid_and_open((1, 1))
+        assert not world.space_valid_and_open((0, 0))
+
+        shared = make_world(agents_can_share_spaces=True)
+        shared.add_agent(make_agent(), (0, 0))
+        assert shared.space_valid_and_open((0, 0))
+
+    @staticmethod
+    def test_queries_outside_map():
+        world = make_world()
+        for pos in [(-1, 0), (0, -1), (3, 0), (0, 4)]:
+            assert not world.space_within_map_bounds(pos)
+            assert not world.space_valid_and_open(pos)
+            assert world.position_passable(pos)
+            assert not world.position_occupied(pos)
+            assert world.get_agents_at_position(pos) == []
+            assert world.get_objects_at_position(pos) == []
+
+    @staticmethod
+    def test_move_blocked_by_walls_agents_and_edges():
+        world = make_world({(0, 1): Wall})
+        agent, other = make_agent(), make_agent()
+        world.add_agent(agent, (0, 0), Direction.RIGHT)
+        world.add_agent(other, (1, 0))
+
+        agent.move_forward()                # wall
+        assert agent.position == (0, 0)
+
+        agent.turn_right()
+        agent.move_forward()                # other agent
+        assert agent.position == (0, 0)
+
+        agent.turn_right()
+        agent.move_forward()                # edge of the map
+        assert agent.position == (0, 0)
+        assert world.get_agents_at_position((0, 0)) == [agent]
+
+    @staticmethod
+    def test_reward_triggered_on_arrival():
+        world = make_world({(0, 1): Food})
+        agent = make_agent()
+        world.add_agent(agent, (0, 0), Direction.RIGHT)
+
+        agent.move_forward()
+        assert agent.score == 1
+        assert world.get_objects_at_position((0, 1))[0].remaining == 2
+
+
+class TestGridWorldTick:
+
+    @staticmethod
+    def test_agents_changed_between_tick_calls():
+        world = make_world()
+        first, second = Counter(), Counter()
+        world.add_agent(first, (0, 0))
+        world.tick(2)
+
+        world.add_agent(second, (0, 1))
+        world.tick()
+        assert (first.ticks, second.ticks) == (3, 1)
+
+        world.remove_agent(first)
+        world.tick()
+        assert (first.ticks, second.ticks) == (3, 2)
+
+        world.clear_agents()
+        world.tick()
+        assert second.ticks == 2
+
+    @staticmethod
+    def test_agent_added_during_tick_call():
+        world = make_world()
+        late = Counter()
+
+        def add_late(agent):
+            if agent.ticks == 1:
+                world.add_agent(late, (1, 1))
+
+        world.add_agent(Counter(add_late), (0, 0))
+        world.tick(3)
+        assert late.ticks == 2
+
+
+class TestGridWorldTrace:
+
+    @staticmethod
+    def test_changes_while_not_recording_are_recorded():
+        world = make_world()
+        agent = make_agent()
+        world.load_new_agents({agent: ((0, 0), Direction.RIGHT)}, recording_on=True)
+
+        world.toggle_recording_off()
+        agent.move_forward()
+        agent.turn_around()
+        agent.move_forward()
+        world.toggle_recording_on()
+        world._record_state()
+
+        agent_trace, _ = world.get_traces()
+        assert agent_trace[-1] == ((GridWorldAgent, (0, 0), Direction.LEFT),)
+
+    @staticmethod
+    def test_unchanged_steps_share_the_previous_step():
+        world = make_world({(0, 2): Food})
+        agent = make_agent()
+        world.load_new_agents({agent: ((0, 0), Direction.RIGHT)}, recording_on=True)
+
+        world._record_state()               # nothing changed
+        agent.move_forward()
+        world._record_state()               # agent moved
+        agent.move_forward()
+        world._record_state()               # agent moved onto the food
+
+        agent_trace, obj_trace = world.get_traces()
+        assert len(agent_trace) == len(obj_trace) == 4
+
+        assert agent_trace[1] is agent_trace[0]
+        assert agent_trace[0] == ((GridWorldAgent, (0, 0), Direction.RIGHT),)
+        assert agent_trace[2] == ((GridWorldAgent, (0, 1), Direction.RIGHT),)
+        assert agent_trace[3] == ((GridWorldAgent, (0, 2), Direction.RIGHT),)
+
+        assert obj_trace[0] == ((Food, (0, 2)),)
+        assert obj_trace[1] is obj_trace[0]
+        assert obj_trace[2] is obj_trace[0]